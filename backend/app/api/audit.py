@@ -0,0 +1,36 @@
+"""Audit helpers for route handlers."""
+from fastapi import Request
+
+from app.config import AUDIT_ROLE_HEADER, AUDIT_USER_HEADER
+from app.models.audit import AuditAction, AuditModule, AuditResult
+from app.services.audit_service import get_audit_service
+
+
+def audit_request(
+    request: Request,
+    module: AuditModule,
+    action: AuditAction,
+    target: str,
+    result: AuditResult = AuditResult.SUCCESS
+):
+    """
+    Record a mutation performed by the current request.
+
+    The acting user and role are taken from the X-User and X-User-Role
+    headers sent by the frontend.
+
+    Args:
+        request: Incoming request
+        module: Module the action belongs to
+        action: Performed action
+        target: Target of the action
+        result: Result of the action
+    """
+    get_audit_service().record(
+        user=request.headers.get(AUDIT_USER_HEADER, "anonymous"),
+        role=request.headers.get(AUDIT_ROLE_HEADER, "unknown"),
+        module=module,
+        action=action,
+        target=target,
+        result=result,
+    )
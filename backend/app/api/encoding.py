@@ -0,0 +1,201 @@
+"""Response encoding helpers for list endpoints.
+
+Supports sparse fieldsets, content negotiation between row JSON, columnar
+JSON and MessagePack, and negotiated gzip/brotli compression.
+"""
+import gzip
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.config import COMPRESSION_LEVEL, COMPRESSION_MIN_SIZE
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Supported media types
+JSON_MEDIA_TYPE = "application/json"
+COLUMNAR_MEDIA_TYPE = "application/vnd.factory.columnar+json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def parse_fields(fields: Optional[str], model: type[BaseModel]) -> List[str]:
+    """
+    Parse a comma separated ``fields=`` parameter.
+
+    Args:
+        fields: Comma separated field names or None for all fields
+        model: Model the fields belong to
+
+    Returns:
+        Ordered list of field names
+
+    Raises:
+        HTTPException: If an unknown field is requested
+    """
+    all_fields = list(model.model_fields)
+    if not fields:
+        return all_fields
+
+    requested = []
+    for name in fields.split(","):
+        name = name.strip()
+        if name and name not in requested:
+            requested.append(name)
+
+    unknown = [name for name in requested if name not in model.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed fields: {', '.join(all_fields)}"
+        )
+
+    return requested or all_fields
+
+
+def negotiate_media_type(request: Request) -> str:
+    """
+    Pick the response media type from the Accept header.
+
+    The supported type with the highest q-value wins (the first one listed
+    on a tie) and types with q=0 are never picked. MessagePack is only
+    offered when the msgpack package is installed; anything unrecognised
+    falls back to JSON.
+    """
+    best, best_quality = JSON_MEDIA_TYPE, 0.0
+    for part in request.headers.get("accept", "").split(","):
+        media_type, _, params = part.partition(";")
+        media_type = media_type.strip().lower()
+        if media_type == COLUMNAR_MEDIA_TYPE:
+            candidate = COLUMNAR_MEDIA_TYPE
+        elif media_type in MSGPACK_MEDIA_TYPES and msgpack is not None:
+            candidate = MSGPACK_MEDIA_TYPES[0]
+        elif media_type in (JSON_MEDIA_TYPE, "*/*"):
+            candidate = JSON_MEDIA_TYPE
+        else:
+            continue
+        quality = _quality(params)
+        if quality > best_quality:
+            best, best_quality = candidate, quality
+    return best
+
+
+def negotiate_encoding(request: Request) -> Optional[str]:
+    """Pick a content encoding (br or gzip) from the Accept-Encoding header."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().lower().partition(";")
+        if _quality(params) <= 0:
+            continue
+        accepted.add(coding.strip())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def encode_list(
+    items: Sequence[Any],
+    fields: Sequence[str],
+    media_type: str,
+    encoding: Optional[str] = None
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Serialize a list of models in the given format and encoding.
+
+    Row JSON keeps ISO timestamps for compatibility. Columnar JSON and
+    MessagePack encode timestamps as epoch milliseconds.
+
+    Args:
+        items: Models to serialize
+        fields: Field names to include, in order
+        media_type: Negotiated media type
+        encoding: Negotiated content encoding (br, gzip) or None
+
+    Returns:
+        Tuple of (body, applied content encoding or None)
+    """
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        columns = {
+            name: [_compact_value(getattr(item, name)) for item in items]
+            for name in fields
+        }
+        body = _dump_json({"count": len(items), "fields": list(fields), "columns": columns})
+    elif media_type == JSON_MEDIA_TYPE:
+        rows = [{name: getattr(item, name) for name in fields} for item in items]
+        body = _dump_json(rows)
+    else:
+        rows = [
+            {name: _compact_value(getattr(item, name)) for name in fields}
+            for item in items
+        ]
+        body = msgpack.packb(rows, use_bin_type=True)
+
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return body, None
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_LEVEL), "br"
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=COMPRESSION_LEVEL), "gzip"
+    return body, None
+
+
+def build_response(
+    body: bytes,
+    media_type: str,
+    content_encoding: Optional[str] = None
+) -> Response:
+    """Wrap an encoded body in a response with negotiation headers."""
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def _quality(params: str) -> float:
+    """Get the q-value from the parameters of an Accept header entry."""
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def _dump_json(payload: Any) -> bytes:
+    """Dump JSON compactly, encoding datetimes as ISO strings."""
+    return json.dumps(
+        payload,
+        default=json_default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def json_default(value: Any) -> Any:
+    """Fallback JSON encoder for values json does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _compact_value(value: Any) -> Any:
+    """Convert a value to its compact wire form."""
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return value
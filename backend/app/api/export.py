@@ -0,0 +1,89 @@
+"""Streaming export helpers."""
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Sequence
+
+from app.api.encoding import json_default
+
+# Rows serialized per chunk before yielding control to the event loop
+EXPORT_CHUNK_ROWS = 500
+
+
+async def stream_csv(items: Iterable[Any], fields: Sequence[str]) -> AsyncIterator[bytes]:
+    """
+    Stream items as CSV, one chunk of rows at a time.
+
+    The header row is sent immediately. List values are joined with ";".
+
+    Args:
+        items: Lazily produced models
+        fields: Field names (columns), in order
+
+    Yields:
+        UTF-8 encoded CSV chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield _drain(buffer)
+
+    rows = 0
+    for item in items:
+        writer.writerow([_csv_value(getattr(item, name)) for name in fields])
+        rows += 1
+        if rows % EXPORT_CHUNK_ROWS == 0:
+            yield _drain(buffer)
+            await asyncio.sleep(0)
+
+    if buffer.tell():
+        yield _drain(buffer)
+
+
+async def stream_ndjson(items: Iterable[Any], fields: Sequence[str]) -> AsyncIterator[bytes]:
+    """
+    Stream items as newline-delimited JSON, one chunk of rows at a time.
+
+    Args:
+        items: Lazily produced models
+        fields: Field names, in order
+
+    Yields:
+        UTF-8 encoded NDJSON chunks
+    """
+    lines = []
+    for item in items:
+        lines.append(json.dumps(
+            {name: getattr(item, name) for name in fields},
+            default=json_default,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ))
+        if len(lines) == EXPORT_CHUNK_ROWS:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+            await asyncio.sleep(0)
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    """Return the buffered text as bytes and reset the buffer."""
+    data = buffer.getvalue().encode("utf-8")
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert a value to its CSV cell form."""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ";".join(str(v) for v in value)
+    return value
@@ -0,0 +1,316 @@
+"""ASGI middleware."""
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from starlette.exceptions import HTTPException
+
+from app.config import FILE_SIGNATURES, MAX_UPLOAD_REQUEST_SIZE
+from app.services.file_service import SIGNATURE_READ_SIZE
+from app.services.tracing import STATUS_ERROR, TRACEPARENT_HEADER, get_tracer
+
+
+class _BodyTooLarge(HTTPException):
+    """
+    Raised by the receive wrapper when the body exceeds the limit.
+
+    Being an HTTPException, it passes through FastAPI's body parsing and
+    is rendered as a 413 response by the regular exception handling.
+    """
+
+
+class _SignatureMismatch(HTTPException):
+    """Raised by the receive wrapper when a file part has the wrong leading bytes."""
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized multipart uploads before their body is buffered.
+
+    Requests announcing a larger Content-Length are answered with 413
+    without reading the body. Requests without a Content-Length (chunked)
+    are counted while streaming and aborted as soon as the limit is
+    crossed. ``path_limits`` maps path regexes to their own limits (for
+    example, batch uploads).
+    """
+
+    def __init__(
+        self,
+        app,
+        max_size: int = MAX_UPLOAD_REQUEST_SIZE,
+        path_limits: Optional[Dict[str, int]] = None
+    ):
+        self.app = app
+        self.max_size = max_size
+        self.path_limits = [
+            (re.compile(pattern), limit) for pattern, limit in (path_limits or {}).items()
+        ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _is_multipart(scope):
+            await self.app(scope, receive, send)
+            return
+
+        max_size = self._limit_for(scope["path"])
+        content_length = _header(scope, b"content-length")
+        if content_length is not None:
+            try:
+                too_large = int(content_length) > max_size
+            except ValueError:
+                await _send_error(send, 400, "Invalid Content-Length header")
+                return
+            if too_large:
+                await _send_error(send, 413, _too_large_detail(max_size))
+                return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_size:
+                    raise _BodyTooLarge(status_code=413, detail=_too_large_detail(max_size))
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _BodyTooLarge:
+            if not response_started:
+                await _send_error(send, 413, _too_large_detail(max_size))
+
+    def _limit_for(self, path: str) -> int:
+        """Get the body size limit for a request path."""
+        for pattern, limit in self.path_limits:
+            if pattern.search(path):
+                return limit
+        return self.max_size
+
+
+class UploadSignatureMiddleware:
+    """
+    Reject uploads whose content does not match their extension while streaming.
+
+    The multipart body is scanned as it is received. As soon as the first
+    bytes of a file part are available they are checked against
+    FILE_SIGNATURES for the part's filename extension, and a mismatch is
+    answered with 400 before the rest of the body is spooled. Only paths
+    matching one of ``paths`` are checked; batch endpoints report rejected
+    files individually and are left to FileService.validate_file_signature.
+    """
+
+    def __init__(self, app, paths: Iterable[str] = ()):
+        self.app = app
+        self.paths = [re.compile(pattern) for pattern in paths]
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not _is_multipart(scope)
+            or not any(pattern.search(scope["path"]) for pattern in self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        boundary = _multipart_boundary(scope)
+        if boundary is None:
+            # Malformed; let the form parser produce the error
+            await self.app(scope, receive, send)
+            return
+
+        sniffer = _SignatureSniffer(boundary)
+        response_started = False
+
+        async def sniffing_receive():
+            message = await receive()
+            if message["type"] == "http.request":
+                detail = sniffer.feed(message.get("body", b""))
+                if detail is not None:
+                    raise _SignatureMismatch(status_code=400, detail=detail)
+            return message
+
+        async def tracking_send(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, sniffing_receive, tracking_send)
+        except _SignatureMismatch as e:
+            if not response_started:
+                await _send_error(send, 400, e.detail)
+
+
+class _SignatureSniffer:
+    """
+    Incremental multipart scanner checking the leading bytes of file parts.
+
+    Only part boundaries, part headers and the first bytes of each file
+    part are buffered; the rest of the content is skipped while searching
+    for the next boundary.
+    """
+
+    MAX_HEADER_SIZE = 16 * 1024
+
+    def __init__(self, boundary: bytes):
+        self._delimiter = b"\r\n--" + boundary
+        # The first delimiter is not preceded by a line break
+        self._buffer = b"\r\n"
+        self._state = "delimiter"
+        self._ext = ""
+
+    def feed(self, chunk: bytes) -> Optional[str]:
+        """
+        Consume the next chunk of the body.
+
+        Returns:
+            Error detail if a file part does not match its extension
+        """
+        if self._state == "done":
+            return None
+        self._buffer += chunk
+
+        while True:
+            if self._state == "delimiter":
+                index = self._buffer.find(self._delimiter)
+                if index < 0:
+                    # Keep a tail in case the delimiter spans two chunks
+                    self._buffer = self._buffer[-(len(self._delimiter) - 1):]
+                    return None
+                self._buffer = self._buffer[index + len(self._delimiter):]
+                self._state = "headers"
+
+            elif self._state == "headers":
+                end = self._buffer.find(b"\r\n\r\n")
+                if end < 0:
+                    if len(self._buffer) > self.MAX_HEADER_SIZE:
+                        # Not a well-formed part; leave it to the form parser
+                        self._state = "done"
+                    return None
+                self._ext = _part_extension(self._buffer[:end])
+                self._buffer = self._buffer[end + 4:]
+                self._state = "content" if self._ext in FILE_SIGNATURES else "delimiter"
+
+            else:
+                index = self._buffer.find(self._delimiter)
+                if index < 0 and len(self._buffer) < SIGNATURE_READ_SIZE + len(self._delimiter):
+                    # Not enough content yet to tell it from a delimiter
+                    return None
+                header = self._buffer[:index if index >= 0 else SIGNATURE_READ_SIZE]
+                header = header[:SIGNATURE_READ_SIZE]
+                # Empty files are reported by the route
+                if header and not any(
+                    header.startswith(signature) for signature in FILE_SIGNATURES[self._ext]
+                ):
+                    self._state = "done"
+                    return f"File content does not match the {self._ext} file type"
+                self._state = "delimiter"
+
+
+class TracingMiddleware:
+    """
+    Open the server span of sampled requests.
+
+    The trace continues an incoming W3C ``traceparent`` header. The span is
+    named after the matched route template, records the response status and
+    ends when the response body has been sent. Sampled responses carry the
+    trace ID in ``X-Trace-Id``. Unsampled requests pass straight through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        root = get_tracer().start_trace(
+            f"{method} {scope['path']}", _header(scope, TRACEPARENT_HEADER.encode("latin-1"))
+        )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        root.set_attribute("http.method", method)
+        root.set_attribute("http.target", scope["path"])
+        trace_id_header = (b"x-trace-id", root.trace_id.encode("latin-1"))
+
+        async def traced_send(message):
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                root.set_attribute("http.status_code", status_code)
+                if status_code >= 500:
+                    root.status = STATUS_ERROR
+                message["headers"] = list(message.get("headers", [])) + [trace_id_header]
+            await send(message)
+
+        with root:
+            try:
+                await self.app(scope, receive, traced_send)
+            finally:
+                route = scope.get("route")
+                if route is not None:
+                    root.name = f"{method} {route.path}"
+                    root.set_attribute("http.route", route.path)
+
+
+def _too_large_detail(max_size: int) -> str:
+    """Error message for an oversized request body."""
+    max_size_mb = max_size / (1024 * 1024)
+    return f"Request body exceeds maximum allowed size of {max_size_mb:.1f}MB"
+
+
+def _header(scope, name: bytes):
+    """Get a request header value from the ASGI scope."""
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _is_multipart(scope) -> bool:
+    """Check whether the request carries a multipart body."""
+    content_type = _header(scope, b"content-type") or ""
+    return content_type.lower().startswith("multipart/")
+
+
+def _multipart_boundary(scope) -> Optional[bytes]:
+    """Get the multipart boundary from the Content-Type header."""
+    content_type = _header(scope, b"content-type") or ""
+    match = re.search(r'boundary="?([^";]+)"?', content_type, re.IGNORECASE)
+    return match.group(1).encode("latin-1") if match else None
+
+
+def _part_extension(headers: bytes) -> str:
+    """Get the lowercased filename extension from multipart part headers."""
+    match = re.search(rb'filename="([^"]*)"', headers, re.IGNORECASE)
+    if not match:
+        return ""
+    return Path(match.group(1).decode("utf-8", "replace")).suffix.lower()
+
+
+async def _send_error(send, status_code: int, detail: str):
+    """Send a JSON error response in the same shape as HTTPException."""
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"connection", b"close"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,55 @@
+"""Audit log routes."""
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Query
+
+from app.models.audit import AuditLogPage, AuditModule
+from app.services.audit_service import get_audit_service
+
+router = APIRouter(prefix="/audit", tags=["audit"])
+
+
+@router.get(
+    "/logs",
+    response_model=AuditLogPage,
+    summary="Get audit log entries",
+    description="Get a page of audit log entries (newest first) with optional filtering",
+)
+async def get_audit_logs(
+    module: Optional[AuditModule] = None,
+    user: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[int] = Query(None, ge=0, description="Cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=500, description="Page size")
+):
+    """
+    Get audit log entries.
+    
+    - **module**: Filter by module (HR, Warehouse, Production, Maintenance)
+    - **user**: Filter by user
+    - **start** / **end**: Filter by time range
+    - **cursor**: Cursor returned as `next_cursor` by the previous page
+    - **limit**: Page size
+    
+    Returns a page of audit log entries.
+    """
+    audit_service = get_audit_service()
+    return await audit_service.query(
+        module=module,
+        user=user,
+        start=start,
+        end=end,
+        cursor=cursor,
+        limit=limit
+    )
+
+
+@router.get(
+    "/stats",
+    summary="Get audit log statistics",
+    description="Get buffer, index and segment statistics of the audit log",
+)
+async def get_audit_stats():
+    """Get audit log statistics."""
+    return get_audit_service().get_stats()
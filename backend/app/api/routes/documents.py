@@ -1,10 +1,19 @@
 """Document routes."""
 from datetime import datetime
-from fastapi import APIRouter, UploadFile, File, HTTPException, status
+from typing import List
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Request, status
 from pathlib import Path
 
-from app.models.document import DocumentMetadata
+from app.api.audit import audit_request
+from app.models.audit import AuditAction, AuditModule, AuditResult
+from app.models.document import (
+    DocumentExtractionInfo,
+    DocumentMetadata,
+    DocumentSearchResult
+)
+from app.services.document_service import get_document_service
 from app.services.file_service import FileService
+from app.services.upload_gc import get_upload_reclaimer
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -16,23 +25,31 @@ router = APIRouter(prefix="/documents", tags=["documents"])
     summary="Upload a document",
     description="Upload a document file (PDF, DOCX, JPG) and receive metadata",
 )
-async def upload_document(file: UploadFile = File(..., description="Document file to upload")):
+async def upload_document(
+    request: Request,
+    file: UploadFile = File(..., description="Document file to upload")
+):
     """
     Upload a document file.
     
     - **file**: Document file (PDF, DOCX, JPG)
     
     Returns document metadata including filename, upload date, and status.
+    PDF and DOCX files are queued for background text extraction.
     """
     file_service = FileService()
+    audit_target = f"Document: {file.filename}"
     
     # Validate file
     try:
         file_ext, content_type = file_service.validate_file(file)
         file_size = await file_service.validate_file_size(file)
+        await file_service.validate_file_signature(file, file_ext)
     except HTTPException:
+        audit_request(request, AuditModule.HR, AuditAction.UPLOADED, audit_target, AuditResult.FAILED)
         raise
     except Exception as e:
+        audit_request(request, AuditModule.HR, AuditAction.UPLOADED, audit_target, AuditResult.FAILED)
         raise HTTPException(
             status_code=500,
             detail=f"Error validating file: {str(e)}"
@@ -45,6 +62,9 @@ async def upload_document(file: UploadFile = File(..., description="Document fil
     try:
         file_path = await file_service.save_file(file, unique_filename)
     except Exception as e:
+        # Partially written file
+        get_upload_reclaimer().release(unique_filename)
+        audit_request(request, AuditModule.HR, AuditAction.UPLOADED, audit_target, AuditResult.FAILED)
         raise HTTPException(
             status_code=500,
             detail=f"Error saving file: {str(e)}"
@@ -63,9 +83,62 @@ async def upload_document(file: UploadFile = File(..., description="Document fil
         file_type=content_type,
     )
     
+    # Register document and queue text extraction
+    document_service = get_document_service()
+    metadata = await document_service.add_document(metadata)
+    
+    audit_request(request, AuditModule.HR, AuditAction.UPLOADED, f"Document: {unique_filename}")
     return metadata
 
 
+@router.get(
+    "/search",
+    response_model=List[DocumentSearchResult],
+    summary="Search document content",
+    description="Search the extracted text of uploaded PDF and DOCX documents",
+)
+async def search_documents(
+    q: str = Query(..., min_length=2, description="Text to search for"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results")
+):
+    """
+    Search documents by content.
+    
+    - **q**: Text to search for (case-insensitive)
+    - **limit**: Maximum number of results
+    
+    Returns matching documents with a text snippet.
+    """
+    document_service = get_document_service()
+    return document_service.search(q, limit=limit)
+
+
+@router.get(
+    "/{filename}/extraction",
+    response_model=DocumentExtractionInfo,
+    summary="Get text extraction status",
+    description="Get the text extraction status of an uploaded document",
+)
+async def get_extraction_status(filename: str):
+    """
+    Get text extraction status.
+    
+    - **filename**: Stored document filename
+    
+    Returns the extraction status and extracted text size.
+    """
+    document_service = get_document_service()
+    info = document_service.get_extraction_info(filename)
+    
+    if not info:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Document {filename} not found"
+        )
+    
+    return info
+
+
 @router.get(
     "/health",
     summary="Health check",
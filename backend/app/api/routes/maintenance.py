@@ -1,20 +1,44 @@
 """Maintenance routes."""
+import asyncio
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, UploadFile, File
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Query, Request, status, UploadFile, File
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
+from app.api.audit import audit_request
+from app.api.encoding import (
+    build_response,
+    encode_list,
+    negotiate_encoding,
+    negotiate_media_type,
+    parse_fields
+)
+from app.api.export import stream_csv, stream_ndjson
+from app.config import MAX_PHOTO_BATCH_FILES, PHOTO_EXTENSIONS
+from app.models.audit import AuditAction, AuditModule, AuditResult
 from app.models.maintenance import (
+    DispatchClaim,
     FailureReport,
     FailureReportCreate,
     FailureReportUpdate,
-    MaintenanceStatus
+    MaintenanceStatus,
+    PhotoBatchResult,
+    PhotoUploadResult,
+    SlaBreach,
+    SlaKind
 )
 from app.services.maintenance_service import get_maintenance_service
+from app.services.sla_watchdog import get_sla_watchdog
 from app.services.file_service import FileService
+from app.services.query_cache import get_report_query_cache
+from app.services.upload_gc import get_upload_reclaimer
 
 router = APIRouter(prefix="/maintenance", tags=["maintenance"])
 
+# Interval of SSE comments that keep idle event streams open
+SLA_EVENT_KEEPALIVE_SECONDS = 15.0
+
 
 @router.post(
     "/failure-reports",
@@ -23,7 +47,7 @@ router = APIRouter(prefix="/maintenance", tags=["maintenance"])
     summary="Create a failure report",
     description="Create a new failure report by line master",
 )
-async def create_failure_report(report_data: FailureReportCreate):
+async def create_failure_report(request: Request, report_data: FailureReportCreate):
     """
     Create a new failure report.
     
@@ -38,8 +62,13 @@ async def create_failure_report(report_data: FailureReportCreate):
     service = get_maintenance_service()
     try:
         report = service.create_failure_report(report_data)
+        audit_request(request, AuditModule.MAINTENANCE, AuditAction.CREATED, f"Failure Report {report.id}")
         return report
     except Exception as e:
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.CREATED,
+            f"Failure Report for line {report_data.line_id}", AuditResult.FAILED
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error creating failure report: {str(e)}"
@@ -50,27 +79,53 @@ async def create_failure_report(report_data: FailureReportCreate):
     "/failure-reports",
     response_model=List[FailureReport],
     summary="Get all failure reports",
-    description="Get all failure reports with optional filtering",
+    description=(
+        "Get all failure reports with optional filtering. Supports sparse "
+        "fieldsets (`fields=`), columnar JSON "
+        "(`Accept: application/vnd.factory.columnar+json`), MessagePack "
+        "(`Accept: application/msgpack`) and gzip/brotli compression."
+    ),
 )
 async def get_failure_reports(
+    request: Request,
     status_filter: Optional[MaintenanceStatus] = None,
-    line_id: Optional[str] = None
+    line_id: Optional[str] = None,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated list of fields to include (e.g. id,status,line_name)"
+    )
 ):
     """
     Get all failure reports.
     
     - **status_filter**: Filter by status (open, in_progress, closed)
     - **line_id**: Filter by production line ID
+    - **fields**: Only serialize these fields
     
-    Returns a list of failure reports.
+    Returns a list of failure reports in the negotiated format.
+    Identical concurrent queries share one computation and results are
+    cached briefly until the next write.
     """
+    selected_fields = parse_fields(fields, FailureReport)
+    media_type = negotiate_media_type(request)
+    encoding = negotiate_encoding(request)
     service = get_maintenance_service()
-    try:
-        reports = service.get_all_failure_reports(
+    cache = get_report_query_cache()
+    
+    def snapshot():
+        return service.get_all_failure_reports(
             status=status_filter,
-            line_id=line_id
+            line_id=line_id,
+            snapshot=True
         )
-        return reports
+    
+    def compute(reports):
+        return encode_list(reports, selected_fields, media_type, encoding)
+    
+    try:
+        key = (status_filter, line_id, tuple(selected_fields), media_type, encoding)
+        body, content_encoding = await cache.get_or_compute(key, compute, snapshot)
+        return build_response(body, media_type, content_encoding)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -78,6 +133,65 @@ async def get_failure_reports(
         )
 
 
+@router.get(
+    "/failure-reports/export",
+    summary="Export failure reports",
+    description="Stream failure reports as CSV or NDJSON with optional filtering",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/csv": {}, "application/x-ndjson": {}}}},
+)
+async def export_failure_reports(
+    export_format: str = Query(
+        "csv", alias="format", pattern="^(csv|ndjson)$", description="Export format (csv, ndjson)"
+    ),
+    status_filter: Optional[MaintenanceStatus] = None,
+    line_id: Optional[str] = None,
+    created_from: Optional[datetime] = Query(None, description="Only reports created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only reports created before this time")
+):
+    """
+    Export failure reports.
+    
+    - **format**: csv or ndjson
+    - **status_filter**: Filter by status (open, in_progress, closed)
+    - **line_id**: Filter by production line ID
+    - **created_from** / **created_to**: Filter by creation date range
+    
+    Rows are streamed oldest first as they are serialized, so memory use
+    does not depend on the number of exported reports.
+    """
+    service = get_maintenance_service()
+    reports = service.iter_failure_reports(
+        status=status_filter,
+        line_id=line_id,
+        created_from=created_from,
+        created_to=created_to
+    )
+    fields = list(FailureReport.model_fields)
+    filename = f"failure_reports_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+    
+    if export_format == "csv":
+        content, media_type = stream_csv(reports, fields), "text/csv"
+    else:
+        content, media_type = stream_ndjson(reports, fields), "application/x-ndjson"
+    
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get(
+    "/failure-reports/cache-stats",
+    summary="Get report query cache statistics",
+    description="Get hit, miss and coalesced counters of the report list cache",
+)
+async def get_cache_stats():
+    """Get report query cache statistics."""
+    return get_report_query_cache().get_stats()
+
+
 @router.get(
     "/failure-reports/{report_id}",
     response_model=FailureReport,
@@ -111,6 +225,7 @@ async def get_failure_report(report_id: str):
     description="Update a failure report (status, assignment, comments, etc.)",
 )
 async def update_failure_report(
+    request: Request,
     report_id: str,
     update_data: FailureReportUpdate
 ):
@@ -125,12 +240,24 @@ async def update_failure_report(
     service = get_maintenance_service()
     report = service.update_failure_report(report_id, update_data)
     
+    if update_data.status:
+        action = AuditAction.STATUS_CHANGED
+    elif update_data.assigned_to:
+        action = AuditAction.ASSIGNED
+    else:
+        action = AuditAction.UPDATED
+    
     if not report:
+        audit_request(
+            request, AuditModule.MAINTENANCE, action,
+            f"Failure Report {report_id}", AuditResult.FAILED
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Failure report with ID {report_id} not found"
         )
     
+    audit_request(request, AuditModule.MAINTENANCE, action, f"Failure Report {report_id}")
     return report
 
 
@@ -140,7 +267,7 @@ async def update_failure_report(
     summary="Mark worker arrived",
     description="Mark that maintenance worker has arrived at the line",
 )
-async def mark_worker_arrived(report_id: str):
+async def mark_worker_arrived(request: Request, report_id: str):
     """
     Mark that maintenance worker has arrived.
     
@@ -153,11 +280,19 @@ async def mark_worker_arrived(report_id: str):
     report = service.mark_worker_arrived(report_id)
     
     if not report:
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.STATUS_CHANGED,
+            f"Worker arrived: Failure Report {report_id}", AuditResult.FAILED
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Failure report with ID {report_id} not found"
         )
     
+    audit_request(
+        request, AuditModule.MAINTENANCE, AuditAction.STATUS_CHANGED,
+        f"Worker arrived: Failure Report {report_id}"
+    )
     return report
 
 
@@ -168,6 +303,7 @@ async def mark_worker_arrived(report_id: str):
     description="Upload a photo report for a failure report",
 )
 async def upload_photo_to_report(
+    request: Request,
     report_id: str,
     file: UploadFile = File(..., description="Photo file to upload")
 ):
@@ -181,8 +317,13 @@ async def upload_photo_to_report(
     """
     service = get_maintenance_service()
     report = service.get_failure_report(report_id)
+    audit_target = f"Photo Report: Failure Report {report_id}"
     
     if not report:
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+            audit_target, AuditResult.FAILED
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Failure report with ID {report_id} not found"
@@ -190,18 +331,20 @@ async def upload_photo_to_report(
     
     # Validate and save file
     file_service = FileService()
+    unique_filename = None
     
     try:
         file_ext, content_type = file_service.validate_file(file)
         
         # Only allow image files for photos
-        if file_ext not in [".jpg", ".jpeg", ".png"]:
+        if file_ext not in PHOTO_EXTENSIONS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Only image files (JPG, PNG) are allowed for photo reports"
             )
         
         file_size = await file_service.validate_file_size(file)
+        await file_service.validate_file_signature(file, file_ext)
         unique_filename = file_service.generate_unique_filename(file.filename)
         file_path = await file_service.save_file(file, unique_filename)
         file_info = file_service.get_file_info(file_path)
@@ -216,24 +359,148 @@ async def upload_photo_to_report(
                 detail=f"Failure report with ID {report_id} not found"
             )
         
+        audit_request(request, AuditModule.MAINTENANCE, AuditAction.UPLOADED, audit_target)
         return report
         
     except HTTPException:
+        if unique_filename:
+            # Saved (possibly partially) but not attached to the report
+            get_upload_reclaimer().release(unique_filename)
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+            audit_target, AuditResult.FAILED
+        )
         raise
     except Exception as e:
+        if unique_filename:
+            get_upload_reclaimer().release(unique_filename)
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+            audit_target, AuditResult.FAILED
+        )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error uploading photo: {str(e)}"
         )
 
 
+@router.post(
+    "/failure-reports/{report_id}/photos/batch",
+    response_model=PhotoBatchResult,
+    summary="Upload several photos to failure report",
+    description="Upload many photos in one request; each file succeeds or fails on its own",
+)
+async def upload_photos_to_report(
+    request: Request,
+    report_id: str,
+    files: List[UploadFile] = File(..., description="Photo files to upload")
+):
+    """
+    Upload several photos to a failure report.
+    
+    - **report_id**: Failure report ID
+    - **files**: Photo files (JPG, PNG)
+    
+    Files are validated and written in parallel, and all stored photo URLs
+    are attached to the report in one update. A rejected file does not
+    affect the others. Returns the updated report and per-file results.
+    """
+    service = get_maintenance_service()
+    report = service.get_failure_report(report_id)
+    audit_target = f"Photo Report: Failure Report {report_id}"
+    
+    if not report:
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+            audit_target, AuditResult.FAILED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Failure report with ID {report_id} not found"
+        )
+    
+    if len(files) > MAX_PHOTO_BATCH_FILES:
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+            audit_target, AuditResult.FAILED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many files. Maximum {MAX_PHOTO_BATCH_FILES} photos per request"
+        )
+    
+    file_service = FileService()
+    results = await asyncio.gather(*(_store_photo(file_service, file) for file in files))
+    
+    stored = [result.photo_url for result in results if result.success]
+    report = service.add_photos_to_report(report_id, stored)
+    
+    if not report:
+        # Deleted while the photos were being saved
+        reclaimer = get_upload_reclaimer()
+        for photo_url in stored:
+            reclaimer.release(Path(photo_url).name)
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+            audit_target, AuditResult.FAILED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Failure report with ID {report_id} not found"
+        )
+    
+    audit_request(
+        request, AuditModule.MAINTENANCE, AuditAction.UPLOADED,
+        f"Photo Report: {len(stored)} of {len(files)} images for Failure Report {report_id}",
+        AuditResult.SUCCESS if stored else AuditResult.FAILED
+    )
+    return PhotoBatchResult(report=report, results=results)
+
+
+async def _store_photo(file_service: FileService, file: UploadFile) -> PhotoUploadResult:
+    """Validate and save one photo of a batch, capturing its error."""
+    unique_filename = None
+    try:
+        file_ext, _ = file_service.validate_file(file)
+        
+        # Only allow image files for photos
+        if file_ext not in PHOTO_EXTENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only image files (JPG, PNG) are allowed for photo reports"
+            )
+        
+        await file_service.validate_file_size(file)
+        await file_service.validate_file_signature(file, file_ext)
+        unique_filename = file_service.generate_unique_filename(file.filename)
+        file_path = await file_service.save_file(file, unique_filename)
+        file_info = file_service.get_file_info(file_path)
+        
+        return PhotoUploadResult(
+            filename=file.filename,
+            success=True,
+            photo_url=file_info["file_path"]
+        )
+    except HTTPException as e:
+        return PhotoUploadResult(filename=file.filename, success=False, error=str(e.detail))
+    except Exception as e:
+        if unique_filename:
+            # Partially written file
+            get_upload_reclaimer().release(unique_filename)
+        return PhotoUploadResult(
+            filename=file.filename,
+            success=False,
+            error=f"Error uploading photo: {str(e)}"
+        )
+
+
 @router.delete(
     "/failure-reports/{report_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete failure report",
     description="Delete a failure report",
 )
-async def delete_failure_report(report_id: str):
+async def delete_failure_report(request: Request, report_id: str):
     """
     Delete a failure report.
     
@@ -243,14 +510,127 @@ async def delete_failure_report(report_id: str):
     deleted = service.delete_failure_report(report_id)
     
     if not deleted:
+        audit_request(
+            request, AuditModule.MAINTENANCE, AuditAction.DELETED,
+            f"Failure Report {report_id}", AuditResult.FAILED
+        )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Failure report with ID {report_id} not found"
         )
     
+    audit_request(request, AuditModule.MAINTENANCE, AuditAction.DELETED, f"Failure Report {report_id}")
     return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content=None)
 
 
+@router.post(
+    "/dispatch/next",
+    response_model=FailureReport,
+    responses={204: {"description": "No open failure reports to claim"}},
+    summary="Claim next failure report",
+    description="Atomically claim the highest-priority, oldest open failure report",
+)
+async def claim_next_failure_report(request: Request, claim: DispatchClaim):
+    """
+    Claim the next failure report for a maintenance worker.
+    
+    - **worker**: Maintenance worker name
+    
+    Reports are served by priority (urgent, high, normal, low) and then by
+    age. The claimed report is assigned to the worker and moved to
+    in_progress. Returns 204 when no open report is waiting.
+    """
+    service = get_maintenance_service()
+    report = service.claim_next_report(claim.worker)
+    
+    if not report:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    audit_request(
+        request, AuditModule.MAINTENANCE, AuditAction.ASSIGNED,
+        f"Failure Report {report.id} to {claim.worker}"
+    )
+    return report
+
+
+@router.get(
+    "/dispatch/stats",
+    summary="Get dispatch queue statistics",
+    description="Get the number of open failure reports waiting to be claimed",
+)
+async def get_dispatch_stats():
+    """Get dispatch queue statistics."""
+    service = get_maintenance_service()
+    return {"queued": service.get_dispatch_queue_size()}
+
+
+@router.get(
+    "/sla/breaches",
+    response_model=List[SlaBreach],
+    summary="Get SLA breaches",
+    description="Get failure reports that missed their worker arrival or repair deadline",
+)
+async def get_sla_breaches(
+    active_only: bool = Query(True, description="Only reports that are still overdue"),
+    kind: Optional[SlaKind] = Query(None, description="Filter by deadline kind"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of breaches")
+):
+    """
+    Get SLA breaches, newest first.
+    
+    - **active_only**: Only breaches that are not resolved yet (default true);
+      false returns the recent breach history including resolved ones
+    - **kind**: arrival or repair
+    - **limit**: Maximum number of breaches
+    """
+    return get_sla_watchdog().get_breaches(active_only=active_only, kind=kind, limit=limit)
+
+
+@router.get(
+    "/sla/events",
+    summary="Stream SLA events",
+    description="Server-sent events for SLA breaches and their resolution",
+)
+async def stream_sla_events(request: Request):
+    """
+    Stream SLA events as server-sent events.
+    
+    Each event is a breach in JSON; the event name is `breach` when a
+    deadline is missed and `resolved` when the report is no longer overdue.
+    """
+    watchdog = get_sla_watchdog()
+    queue = watchdog.subscribe()
+    
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    breach = await asyncio.wait_for(queue.get(), SLA_EVENT_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                event = "resolved" if breach.resolved_at else "breach"
+                yield f"event: {event}\ndata: {breach.model_dump_json()}\n\n"
+        finally:
+            watchdog.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get(
+    "/sla/stats",
+    summary="Get SLA watchdog statistics",
+    description="Get the number of tracked deadlines and breaches",
+)
+async def get_sla_stats():
+    """Get SLA watchdog statistics."""
+    return get_sla_watchdog().get_stats()
+
+
 @router.get(
     "/health",
     summary="Health check",
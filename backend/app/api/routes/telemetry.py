@@ -0,0 +1,79 @@
+"""Production line telemetry routes."""
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.models.telemetry import (
+    LineTelemetrySummary,
+    TelemetryBatch,
+    TelemetryIngestResult,
+    TelemetryResolution,
+    TelemetrySeries
+)
+from app.services.telemetry_service import get_telemetry_service
+
+router = APIRouter(prefix="/telemetry", tags=["telemetry"])
+
+
+@router.post(
+    "/samples",
+    response_model=TelemetryIngestResult,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Ingest telemetry samples",
+    description="Ingest a batch of efficiency, output and status samples from line PLCs or gateways",
+)
+async def ingest_samples(batch: TelemetryBatch):
+    """
+    Ingest telemetry samples.
+    
+    - **samples**: List of samples (line_id, timestamp, efficiency, output, status)
+    
+    Returns the number of accepted and rejected samples.
+    """
+    service = get_telemetry_service()
+    return service.ingest(batch.samples)
+
+
+@router.get(
+    "/lines",
+    response_model=List[LineTelemetrySummary],
+    summary="Get latest line telemetry",
+    description="Get the latest telemetry values of all production lines",
+)
+async def get_line_summaries():
+    """Get latest telemetry values of all lines."""
+    service = get_telemetry_service()
+    return service.get_summaries()
+
+
+@router.get(
+    "/lines/{line_id}",
+    response_model=TelemetrySeries,
+    summary="Get line telemetry series",
+    description="Get a time window of a line's telemetry at raw, minute or hour resolution",
+)
+async def get_line_series(
+    line_id: str,
+    resolution: TelemetryResolution = TelemetryResolution.MINUTE,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum number of points")
+):
+    """
+    Get a line's telemetry series.
+    
+    - **line_id**: Production line ID
+    - **resolution**: raw, minute or hour
+    - **start** / **end**: Time window
+    - **limit**: Maximum number of points (most recent kept)
+    """
+    service = get_telemetry_service()
+    series = service.get_series(line_id, resolution, start, end, limit)
+    
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No telemetry for production line {line_id}"
+        )
+    
+    return series
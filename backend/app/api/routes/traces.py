@@ -0,0 +1,58 @@
+"""Request trace debug routes."""
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.services.tracing import get_tracer
+
+router = APIRouter(prefix="/debug/traces", tags=["debug"])
+
+
+@router.get(
+    "",
+    summary="Get recent traces",
+    description="Get recently completed request traces in OTLP JSON format",
+)
+async def get_traces(
+    limit: int = Query(20, ge=1, le=200, description="Maximum number of traces"),
+    min_duration_ms: float = Query(0, ge=0, description="Only traces at least this long")
+):
+    """
+    Get recent traces, newest first.
+    
+    - **limit**: Maximum number of traces
+    - **min_duration_ms**: Only traces whose duration is at least this long
+    
+    Returns an OTLP `ExportTraceServiceRequest` JSON document. Requests are
+    traced when they carry a sampled `traceparent` header or are picked by
+    `TRACING_SAMPLE_RATE`.
+    """
+    return get_tracer().get_traces(limit=limit, min_duration_ms=min_duration_ms)
+
+
+@router.get(
+    "/stats",
+    summary="Get tracing statistics",
+    description="Get sampling, buffer and export counters of the tracer",
+)
+async def get_tracing_stats():
+    """Get tracing statistics."""
+    return get_tracer().get_stats()
+
+
+@router.get(
+    "/{trace_id}",
+    summary="Get a trace",
+    description="Get one buffered trace in OTLP JSON format",
+)
+async def get_trace(trace_id: str):
+    """
+    Get a trace by ID.
+    
+    - **trace_id**: 32-character hex trace ID (returned in `X-Trace-Id`)
+    """
+    trace = get_tracer().get_trace(trace_id.lower())
+    if trace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trace {trace_id} not found"
+        )
+    return trace
@@ -0,0 +1,56 @@
+"""Upload storage routes."""
+from typing import Union
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.models.upload_gc import UploadGcPass, UploadGcStatus
+from app.services.upload_gc import get_upload_reclaimer
+
+router = APIRouter(prefix="/uploads", tags=["uploads"])
+
+
+@router.get(
+    "/gc",
+    response_model=UploadGcStatus,
+    summary="Get upload reclaimer status",
+    description="Get the progress and results of the orphaned upload reclaimer",
+)
+async def get_gc_status():
+    """Get upload reclaimer status."""
+    return get_upload_reclaimer().get_status()
+
+
+@router.post(
+    "/gc/run",
+    response_model=Union[UploadGcPass, UploadGcStatus],
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Run upload reclaimer",
+    description="Start a pass of the orphaned upload reclaimer",
+)
+async def run_gc(
+    dry_run: bool = Query(False, description="Only report orphans without deleting them"),
+    wait: bool = Query(False, description="Wait for the pass and return its result")
+):
+    """
+    Run a pass of the orphaned upload reclaimer.
+    
+    - **dry_run**: Only report orphans and the bytes they occupy. Otherwise
+      files known to be orphaned (detached photos, failed uploads) that are
+      older than the grace period are deleted; other unreferenced files are
+      only reported.
+    - **wait**: Wait for the pass to finish and return its result instead of
+      the reclaimer status
+    
+    Returns 409 if a pass is already running.
+    """
+    reclaimer = get_upload_reclaimer()
+    if reclaimer.running:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An upload reclaimer pass is already running"
+        )
+    
+    if wait:
+        return await reclaimer.run_pass(dry_run=dry_run)
+    
+    reclaimer.trigger(dry_run=dry_run)
+    return reclaimer.get_status()
@@ -0,0 +1,264 @@
+"""Warehouse routes."""
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Request, status
+
+from app.api.audit import audit_request
+from app.models.audit import AuditAction, AuditModule, AuditResult
+from app.models.warehouse import (
+    Material,
+    MaterialCreate,
+    Reservation,
+    ReservationCreate,
+    StockMovement,
+    StockReceipt
+)
+from app.services.warehouse_service import (
+    InsufficientStockError,
+    UnknownMaterialError,
+    get_warehouse_service
+)
+
+router = APIRouter(prefix="/warehouse", tags=["warehouse"])
+
+
+@router.get(
+    "/materials",
+    response_model=List[Material],
+    summary="Get all materials",
+    description="Get all materials with their current stock",
+)
+async def get_materials():
+    """Get all materials."""
+    service = get_warehouse_service()
+    return service.get_all_materials()
+
+
+@router.get(
+    "/materials/low-stock",
+    response_model=List[Material],
+    summary="Get low-stock materials",
+    description="Get materials at or below their minimum stock",
+)
+async def get_low_stock_materials():
+    """Get low-stock materials."""
+    service = get_warehouse_service()
+    return service.get_low_stock_materials()
+
+
+@router.get(
+    "/materials/{material_id}",
+    response_model=Material,
+    summary="Get material by ID",
+    description="Get a specific material by its ID",
+)
+async def get_material(material_id: str):
+    """Get a material by ID."""
+    service = get_warehouse_service()
+    material = service.get_material(material_id)
+    
+    if not material:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Material with ID {material_id} not found"
+        )
+    
+    return material
+
+
+@router.post(
+    "/materials",
+    response_model=Material,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create a material",
+    description="Create a new material with an initial quantity",
+)
+async def create_material(request: Request, material_data: MaterialCreate):
+    """
+    Create a new material.
+    
+    - **id**: Unique material ID
+    - **name**: Material name
+    - **quantity**: Initial quantity
+    - **unit**: Unit of measure
+    - **min_stock**: Low-stock threshold
+    - **category**: Material category
+    
+    Returns the created material.
+    """
+    service = get_warehouse_service()
+    material = service.create_material(material_data)
+    
+    if not material:
+        audit_request(
+            request, AuditModule.WAREHOUSE, AuditAction.CREATED,
+            f"Material {material_data.id}", AuditResult.FAILED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Material with ID {material_data.id} already exists"
+        )
+    
+    audit_request(request, AuditModule.WAREHOUSE, AuditAction.CREATED, f"Material {material.id}")
+    return material
+
+
+@router.post(
+    "/materials/{material_id}/receive",
+    response_model=Material,
+    summary="Receive stock",
+    description="Add received stock to a material",
+)
+async def receive_stock(request: Request, material_id: str, receipt: StockReceipt):
+    """
+    Receive stock for a material.
+    
+    - **material_id**: Material ID
+    - **quantity**: Quantity received
+    - **reference**: Delivery note or other reference (optional)
+    
+    Returns the updated material.
+    """
+    service = get_warehouse_service()
+    material = service.receive_stock(material_id, receipt.quantity, receipt.reference)
+    
+    if not material:
+        audit_request(
+            request, AuditModule.WAREHOUSE, AuditAction.UPDATED,
+            f"Material {material_id}", AuditResult.FAILED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Material with ID {material_id} not found"
+        )
+    
+    audit_request(
+        request, AuditModule.WAREHOUSE, AuditAction.UPDATED,
+        f"Material {material_id}: received {receipt.quantity} {material.unit}"
+    )
+    return material
+
+
+@router.post(
+    "/reservations",
+    response_model=Reservation,
+    status_code=status.HTTP_201_CREATED,
+    summary="Reserve materials",
+    description="Reserve a full bill of materials in one all-or-nothing call",
+)
+async def create_reservation(request: Request, reservation_data: ReservationCreate):
+    """
+    Reserve materials.
+    
+    - **items**: Bill of materials (material_id, quantity)
+    - **line_id**: Production line ID (optional)
+    - **requested_by**: Line master name (optional)
+    
+    Either every item is reserved or none is. Returns 409 when any item
+    exceeds the available stock.
+    """
+    service = get_warehouse_service()
+    target = f"Material Request for line {reservation_data.line_id or '-'}"
+    
+    try:
+        reservation = service.reserve(reservation_data)
+    except UnknownMaterialError as e:
+        audit_request(request, AuditModule.WAREHOUSE, AuditAction.CREATED, target, AuditResult.FAILED)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InsufficientStockError as e:
+        audit_request(request, AuditModule.WAREHOUSE, AuditAction.CREATED, target, AuditResult.FAILED)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    audit_request(
+        request, AuditModule.WAREHOUSE, AuditAction.CREATED,
+        f"Material Request {reservation.id} for line {reservation.line_id or '-'}"
+    )
+    return reservation
+
+
+@router.get(
+    "/reservations/{reservation_id}",
+    response_model=Reservation,
+    summary="Get reservation by ID",
+    description="Get a specific material reservation by its ID",
+)
+async def get_reservation(reservation_id: str):
+    """Get a reservation by ID."""
+    service = get_warehouse_service()
+    reservation = service.get_reservation(reservation_id)
+    
+    if not reservation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Reservation with ID {reservation_id} not found"
+        )
+    
+    return reservation
+
+
+@router.post(
+    "/reservations/{reservation_id}/release",
+    response_model=Reservation,
+    summary="Release reservation",
+    description="Release a reservation and return its materials to stock",
+)
+async def release_reservation(request: Request, reservation_id: str):
+    """
+    Release a reservation.
+    
+    - **reservation_id**: Reservation ID
+    
+    Returns the released reservation.
+    """
+    service = get_warehouse_service()
+    reservation = service.release(reservation_id)
+    
+    if not reservation:
+        audit_request(
+            request, AuditModule.WAREHOUSE, AuditAction.STATUS_CHANGED,
+            f"Material Request {reservation_id}", AuditResult.FAILED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Reservation with ID {reservation_id} not found"
+        )
+    
+    audit_request(
+        request, AuditModule.WAREHOUSE, AuditAction.STATUS_CHANGED,
+        f"Material Request {reservation_id}"
+    )
+    return reservation
+
+
+@router.get(
+    "/movements",
+    response_model=List[StockMovement],
+    summary="Get stock movements",
+    description="Get the most recent stock ledger movements",
+)
+async def get_movements(
+    material_id: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of movements")
+):
+    """
+    Get stock movements, newest first.
+    
+    - **material_id**: Filter by material ID
+    - **limit**: Maximum number of movements
+    """
+    service = get_warehouse_service()
+    return service.get_movements(material_id=material_id, limit=limit)
+
+
+@router.get(
+    "/health",
+    summary="Health check",
+    description="Check if the warehouse service is healthy",
+)
+async def health_check():
+    """Health check endpoint."""
+    return {
+        "status": "healthy",
+        "service": "warehouse",
+        "timestamp": datetime.now().isoformat()
+    }
@@ -9,12 +9,36 @@ BASE_DIR = Path(__file__).parent.parent
 UPLOAD_DIR = BASE_DIR / "uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
+# Audit log segment directory
+AUDIT_DIR = BASE_DIR / "audit_logs"
+AUDIT_DIR.mkdir(exist_ok=True)
+
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".jpg", ".jpeg", ".png"}
 
 # Max file size (10MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB in bytes
 
+# Max multipart upload request size: one file plus multipart framing.
+# Larger requests are rejected from the Content-Length header.
+MULTIPART_OVERHEAD = 64 * 1024
+MAX_UPLOAD_REQUEST_SIZE = MAX_FILE_SIZE + MULTIPART_OVERHEAD
+
+# Photo reports
+PHOTO_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+MAX_PHOTO_BATCH_FILES = 20
+# A full batch of maximum-size photos, each with its multipart framing
+MAX_PHOTO_BATCH_REQUEST_SIZE = MAX_PHOTO_BATCH_FILES * (MAX_FILE_SIZE + MULTIPART_OVERHEAD)
+
+# Leading bytes (magic numbers) expected for each allowed extension
+FILE_SIGNATURES = {
+    ".pdf": (b"%PDF-",),
+    ".docx": (b"PK\x03\x04",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+}
+
 # API settings
 API_PREFIX = "/api/v1"
 
@@ -26,3 +50,59 @@ ALLOWED_ORIGINS = [
     "http://127.0.0.1:3000",
     "http://127.0.0.1:5173",
 ]
+
+# Document text extraction settings
+EXTRACTION_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+EXTRACTION_QUEUE_SIZE = 64
+EXTRACTABLE_EXTENSIONS = {".pdf", ".docx"}
+
+# Response compression settings (list endpoints)
+COMPRESSION_MIN_SIZE = 1024  # bytes
+COMPRESSION_LEVEL = 5
+
+# Read query cache settings (failure report list)
+QUERY_CACHE_MAX_ENTRIES = 128
+QUERY_CACHE_TTL_SECONDS = 2.0
+
+# Audit log settings
+AUDIT_BUFFER_SIZE = 10000  # entries held in memory before the oldest are dropped
+AUDIT_FLUSH_BATCH_SIZE = 256
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+AUDIT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024  # 16MB
+AUDIT_USER_HEADER = "X-User"
+AUDIT_ROLE_HEADER = "X-User-Role"
+
+# Warehouse settings
+WAREHOUSE_LOCK_STRIPES = 16
+WAREHOUSE_LEDGER_CAPACITY = 100_000  # most recent movements kept in memory
+
+# Production line telemetry settings (fixed-size ring buffers per line)
+TELEMETRY_RAW_CAPACITY = 3600  # raw samples
+TELEMETRY_MINUTE_CAPACITY = 24 * 60  # one day of minute buckets
+TELEMETRY_HOUR_CAPACITY = 30 * 24  # thirty days of hour buckets
+TELEMETRY_MAX_LINES = 256
+
+# Failure report SLA watchdog (minutes per priority; priorities without an
+# entry have no deadline of that kind)
+SLA_ARRIVAL_MINUTES = {"urgent": 15, "high": 30}
+SLA_REPAIR_MINUTES = {"urgent": 60, "high": 120, "normal": 240, "low": 480}
+SLA_TICK_SECONDS = 1.0
+SLA_BREACH_HISTORY = 1000
+SLA_EVENT_QUEUE_SIZE = 256
+
+# Orphaned upload reclaimer (incremental, rate-limited)
+UPLOAD_GC_GRACE_SECONDS = 60 * 60  # files younger than this are never reclaimed
+UPLOAD_GC_BATCH_SIZE = 64  # directory entries per batch
+UPLOAD_GC_BATCH_PAUSE_SECONDS = 0.2
+UPLOAD_GC_MAX_BYTES_PER_SECOND = 16 * 1024 * 1024
+UPLOAD_GC_PASS_INTERVAL_SECONDS = 15 * 60
+UPLOAD_GC_DRY_RUN = False  # only report orphans in background passes
+UPLOAD_GC_MAX_CANDIDATES = 100  # orphan filenames listed per pass
+
+# Request tracing (W3C traceparent propagation, OTLP JSON export)
+TRACING_SAMPLE_RATE = 0.0  # share of requests without a sampled parent that are traced
+TRACING_SERVICE_NAME = "factory-hr-api"
+TRACING_BUFFER_SIZE = 200  # completed traces kept for the debug endpoint
+TRACING_MAX_SPANS_PER_TRACE = 512
+TRACING_EXPORT_FILE = None  # OTLP JSON lines file, e.g. BASE_DIR / "traces.jsonl"
+TRACING_FLUSH_INTERVAL_SECONDS = 1.0
@@ -1,10 +1,44 @@
 """Main FastAPI application."""
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from app.config import API_PREFIX, ALLOWED_ORIGINS
-from app.api.routes import documents, maintenance
+from app.config import API_PREFIX, ALLOWED_ORIGINS, MAX_PHOTO_BATCH_REQUEST_SIZE
+from app.api.middleware import (
+    TracingMiddleware,
+    UploadSignatureMiddleware,
+    UploadSizeLimitMiddleware,
+)
+from app.api.routes import audit, documents, maintenance, telemetry, traces, uploads, warehouse
+from app.services.audit_service import get_audit_service
+from app.services.document_service import get_document_service
+from app.services.sla_watchdog import get_sla_watchdog
+from app.services.tracing import get_tracer
+from app.services.upload_gc import get_upload_reclaimer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background services."""
+    audit_service = get_audit_service()
+    document_service = get_document_service()
+    sla_watchdog = get_sla_watchdog()
+    upload_reclaimer = get_upload_reclaimer()
+    tracer = get_tracer()
+    await tracer.start()
+    await audit_service.start()
+    await document_service.start()
+    await sla_watchdog.start()
+    await upload_reclaimer.start()
+    yield
+    await upload_reclaimer.stop()
+    await sla_watchdog.stop()
+    await document_service.stop()
+    await audit_service.stop()
+    await tracer.stop()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -13,6 +47,19 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+)
+
+# Reject spoofed single-file uploads from their first bytes
+app.add_middleware(
+    UploadSignatureMiddleware,
+    paths=[r"/documents/upload$", r"/photos$"],
+)
+
+# Reject oversized uploads from their headers (added first so CORS wraps it)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    path_limits={r"/photos/batch$": MAX_PHOTO_BATCH_REQUEST_SIZE},
 )
 
 # Configure CORS
@@ -24,9 +71,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Trace sampled requests (added last so the span covers all middleware)
+app.add_middleware(TracingMiddleware)
+
 # Include routers
 app.include_router(documents.router, prefix=API_PREFIX)
 app.include_router(maintenance.router, prefix=API_PREFIX)
+app.include_router(warehouse.router, prefix=API_PREFIX)
+app.include_router(telemetry.router, prefix=API_PREFIX)
+app.include_router(audit.router, prefix=API_PREFIX)
+app.include_router(uploads.router, prefix=API_PREFIX)
+app.include_router(traces.router, prefix=API_PREFIX)
 
 
 @app.get("/", tags=["root"])
@@ -1,16 +1,87 @@
 """Models package."""
-from .document import DocumentMetadata
+from .audit import (
+    AuditAction,
+    AuditLogEntry,
+    AuditLogPage,
+    AuditModule,
+    AuditResult
+)
+from .document import (
+    DocumentExtractionInfo,
+    DocumentMetadata,
+    DocumentSearchResult,
+    ExtractionStatus
+)
 from .maintenance import (
+    DispatchClaim,
     FailureReport,
     FailureReportCreate,
     FailureReportUpdate,
-    MaintenanceStatus
+    MaintenanceStatus,
+    PhotoBatchResult,
+    PhotoUploadResult,
+    SlaBreach,
+    SlaKind
+)
+from .telemetry import (
+    LineStatus,
+    LineTelemetrySummary,
+    TelemetryBatch,
+    TelemetryIngestResult,
+    TelemetryPoint,
+    TelemetryResolution,
+    TelemetrySample,
+    TelemetrySeries
+)
+from .upload_gc import UploadGcPass, UploadGcStatus
+from .warehouse import (
+    Material,
+    MaterialCreate,
+    MaterialItem,
+    MovementType,
+    Reservation,
+    ReservationCreate,
+    ReservationStatus,
+    StockMovement,
+    StockReceipt
 )
 
 __all__ = [
+    "AuditAction",
+    "AuditLogEntry",
+    "AuditLogPage",
+    "AuditModule",
+    "AuditResult",
+    "DispatchClaim",
+    "DocumentExtractionInfo",
     "DocumentMetadata",
+    "DocumentSearchResult",
+    "ExtractionStatus",
     "FailureReport",
     "FailureReportCreate",
     "FailureReportUpdate",
+    "LineStatus",
+    "LineTelemetrySummary",
     "MaintenanceStatus",
+    "Material",
+    "MaterialCreate",
+    "MaterialItem",
+    "MovementType",
+    "PhotoBatchResult",
+    "PhotoUploadResult",
+    "Reservation",
+    "ReservationCreate",
+    "ReservationStatus",
+    "SlaBreach",
+    "SlaKind",
+    "StockMovement",
+    "StockReceipt",
+    "TelemetryBatch",
+    "TelemetryIngestResult",
+    "TelemetryPoint",
+    "TelemetryResolution",
+    "TelemetrySample",
+    "TelemetrySeries",
+    "UploadGcPass",
+    "UploadGcStatus",
 ]
@@ -0,0 +1,66 @@
+"""Audit log models."""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from enum import Enum
+
+
+class AuditModule(str, Enum):
+    """Audited module enum."""
+    HR = "HR"
+    WAREHOUSE = "Warehouse"
+    PRODUCTION = "Production"
+    MAINTENANCE = "Maintenance"
+
+
+class AuditAction(str, Enum):
+    """Audited action enum."""
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    ASSIGNED = "assigned"
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    UPLOADED = "uploaded"
+    FIXED = "fixed"
+    STATUS_CHANGED = "status_changed"
+
+
+class AuditResult(str, Enum):
+    """Audited action result enum."""
+    SUCCESS = "Success"
+    FAILED = "Failed"
+
+
+class AuditLogEntry(BaseModel):
+    """Audit log entry model."""
+    
+    id: str = Field(..., description="Unique, monotonically increasing entry ID")
+    date_time: datetime = Field(..., description="Timestamp of the action")
+    user: str = Field(..., description="User who performed the action")
+    role: str = Field(..., description="Role of the user")
+    module: AuditModule = Field(..., description="Module the action belongs to")
+    action: AuditAction = Field(..., description="Performed action")
+    target: str = Field(..., description="Target of the action")
+    result: AuditResult = Field(..., description="Result of the action")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "42",
+                "date_time": "2025-01-15T10:30:00",
+                "user": "Line Master John",
+                "role": "Line Master",
+                "module": "Maintenance",
+                "action": "created",
+                "target": "Failure Report fr_123456",
+                "result": "Success"
+            }
+        }
+
+
+class AuditLogPage(BaseModel):
+    """Page of audit log entries (newest first)."""
+    
+    items: List[AuditLogEntry] = Field(default_factory=list, description="Audit log entries")
+    next_cursor: Optional[int] = Field(None, description="Cursor for the next (older) page")
@@ -2,6 +2,16 @@
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
+from enum import Enum
+
+
+class ExtractionStatus(str, Enum):
+    """Text extraction status enum."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+    SKIPPED = "skipped"
 
 
 class DocumentMetadata(BaseModel):
@@ -13,6 +23,10 @@ class DocumentMetadata(BaseModel):
     file_path: Optional[str] = Field(None, description="Path to the stored file")
     file_size: Optional[int] = Field(None, description="File size in bytes")
     file_type: Optional[str] = Field(None, description="MIME type of the file")
+    extraction_status: ExtractionStatus = Field(
+        default=ExtractionStatus.SKIPPED,
+        description="Status of the plain text extraction for search"
+    )
     
     class Config:
         json_schema_extra = {
@@ -22,6 +36,25 @@ class DocumentMetadata(BaseModel):
                 "status": "draft",
                 "file_path": "uploads/employee_handbook_20250115_103000.pdf",
                 "file_size": 1024000,
-                "file_type": "application/pdf"
+                "file_type": "application/pdf",
+                "extraction_status": "pending"
             }
         }
+
+
+class DocumentExtractionInfo(BaseModel):
+    """Text extraction state of a document."""
+    
+    filename: str = Field(..., description="Name of the stored file")
+    status: ExtractionStatus = Field(..., description="Extraction status")
+    text_length: Optional[int] = Field(None, description="Number of extracted characters")
+    compressed_size: Optional[int] = Field(None, description="Size of the stored compressed text in bytes")
+    error: Optional[str] = Field(None, description="Error message if extraction failed")
+
+
+class DocumentSearchResult(BaseModel):
+    """Document content search hit."""
+    
+    document: DocumentMetadata = Field(..., description="Matching document metadata")
+    snippet: str = Field(..., description="Extracted text around the first match")
+    match_count: int = Field(..., description="Number of matches in the document text")
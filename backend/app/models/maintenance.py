@@ -75,5 +75,56 @@ class FailureReport(FailureReportBase):
         }
 
 
+class DispatchClaim(BaseModel):
+    """Dispatch claim request model."""
+    
+    worker: str = Field(..., min_length=1, description="Maintenance worker claiming the next report")
+
+
+class PhotoUploadResult(BaseModel):
+    """Result of one file in a photo batch upload."""
+    
+    filename: Optional[str] = Field(None, description="Original filename")
+    success: bool = Field(..., description="Whether the photo was stored")
+    photo_url: Optional[str] = Field(None, description="Stored photo URL")
+    error: Optional[str] = Field(None, description="Error message if the photo was rejected")
+
 
+class PhotoBatchResult(BaseModel):
+    """Photo batch upload result."""
+    
+    report: FailureReport = Field(..., description="Updated failure report")
+    results: List[PhotoUploadResult] = Field(..., description="Per-file results in upload order")
+
+
+class SlaKind(str, Enum):
+    """Kind of failure report SLA deadline."""
+    ARRIVAL = "arrival"
+    REPAIR = "repair"
 
+
+class SlaBreach(BaseModel):
+    """Missed failure report SLA deadline."""
+    
+    report_id: str = Field(..., description="Failure report ID")
+    line_id: str = Field(..., description="Production line ID")
+    line_name: str = Field(..., description="Production line name")
+    priority: str = Field(..., description="Priority level of the report")
+    kind: SlaKind = Field(..., description="Missed deadline (worker arrival or repair duration)")
+    deadline: datetime = Field(..., description="Time the deadline expired")
+    breached_at: datetime = Field(..., description="Time the breach was detected")
+    resolved_at: Optional[datetime] = Field(None, description="Time the overdue condition ended")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "report_id": "fr_123456",
+                "line_id": "1",
+                "line_name": "Assembly Line A",
+                "priority": "urgent",
+                "kind": "arrival",
+                "deadline": "2025-01-15T10:45:00",
+                "breached_at": "2025-01-15T10:45:01",
+                "resolved_at": None
+            }
+        }
@@ -0,0 +1,73 @@
+"""Production line telemetry models."""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from enum import Enum
+
+
+class LineStatus(str, Enum):
+    """Production line status enum."""
+    ACTIVE = "active"
+    IDLE = "idle"
+    MAINTENANCE = "maintenance"
+
+
+class TelemetryResolution(str, Enum):
+    """Telemetry query resolution enum."""
+    RAW = "raw"
+    MINUTE = "minute"
+    HOUR = "hour"
+
+
+class TelemetrySample(BaseModel):
+    """Single telemetry sample posted by a line PLC or gateway."""
+    
+    line_id: str = Field(..., description="Production line ID")
+    timestamp: Optional[datetime] = Field(None, description="Sample time (defaults to receive time)")
+    efficiency: float = Field(..., ge=0, le=100, description="Line efficiency in percent")
+    output: float = Field(..., ge=0, description="Line output (units per hour)")
+    status: LineStatus = Field(..., description="Line status")
+
+
+class TelemetryBatch(BaseModel):
+    """Batch of telemetry samples."""
+    
+    samples: List[TelemetrySample] = Field(..., min_length=1, description="Telemetry samples")
+
+
+class TelemetryIngestResult(BaseModel):
+    """Telemetry ingest result."""
+    
+    accepted: int = Field(..., description="Number of samples stored")
+    rejected: int = Field(..., description="Number of samples dropped (out of order or line limit)")
+
+
+class TelemetryPoint(BaseModel):
+    """Telemetry point (raw sample or downsampled bucket)."""
+    
+    timestamp: datetime = Field(..., description="Sample time or bucket start")
+    efficiency: float = Field(..., description="Efficiency (average for buckets)")
+    efficiency_min: float = Field(..., description="Minimum efficiency in the bucket")
+    efficiency_max: float = Field(..., description="Maximum efficiency in the bucket")
+    output: float = Field(..., description="Output (average for buckets)")
+    status: LineStatus = Field(..., description="Last status in the bucket")
+    samples: int = Field(..., description="Number of raw samples in the bucket")
+
+
+class TelemetrySeries(BaseModel):
+    """Telemetry time series of a production line."""
+    
+    line_id: str = Field(..., description="Production line ID")
+    resolution: TelemetryResolution = Field(..., description="Resolution of the points")
+    points: List[TelemetryPoint] = Field(default_factory=list, description="Points in time order")
+
+
+class LineTelemetrySummary(BaseModel):
+    """Latest telemetry values of a production line."""
+    
+    line_id: str = Field(..., description="Production line ID")
+    status: LineStatus = Field(..., description="Latest status")
+    efficiency: float = Field(..., description="Latest efficiency")
+    output: float = Field(..., description="Latest output")
+    last_sample_at: datetime = Field(..., description="Time of the latest sample")
+    samples_total: int = Field(..., description="Samples received since startup")
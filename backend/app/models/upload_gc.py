@@ -0,0 +1,53 @@
+"""Upload reclaimer models."""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class UploadGcPass(BaseModel):
+    """Result of one pass of the orphaned upload reclaimer."""
+
+    dry_run: bool = Field(..., description="Orphans were only reported, not deleted")
+    started_at: datetime = Field(..., description="Time the pass started")
+    finished_at: Optional[datetime] = Field(None, description="Time the pass finished (None while running)")
+    scanned: int = Field(default=0, description="Files examined")
+    referenced: int = Field(default=0, description="Files referenced by reports or documents")
+    within_grace: int = Field(default=0, description="Unreferenced files younger than the grace period")
+    unclaimed: int = Field(default=0, description="Unreferenced files not known to be orphaned (never deleted)")
+    unclaimed_bytes: int = Field(default=0, description="Bytes occupied by unclaimed files")
+    orphaned: int = Field(default=0, description="Files known to be orphaned (detached photos, failed uploads)")
+    reclaimed_files: int = Field(default=0, description="Orphaned files deleted")
+    reclaimed_bytes: int = Field(default=0, description="Bytes freed (or freeable in a dry run)")
+    errors: int = Field(default=0, description="Files that could not be examined or deleted")
+    candidates: List[str] = Field(default_factory=list, description="Known orphaned filenames (truncated)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "dry_run": False,
+                "started_at": "2025-01-15T10:30:00",
+                "finished_at": "2025-01-15T10:30:04",
+                "scanned": 1250,
+                "referenced": 1190,
+                "within_grace": 3,
+                "unclaimed": 12,
+                "unclaimed_bytes": 9437184,
+                "orphaned": 45,
+                "reclaimed_files": 45,
+                "reclaimed_bytes": 48234496,
+                "errors": 0,
+                "candidates": ["failure_20250115_093000_abc123.jpg"]
+            }
+        }
+
+
+class UploadGcStatus(BaseModel):
+    """Orphaned upload reclaimer status."""
+
+    running: bool = Field(..., description="A pass is in progress")
+    grace_seconds: int = Field(..., description="Minimum age of a reclaimable file")
+    passes: int = Field(..., description="Completed passes")
+    reclaimed_files_total: int = Field(..., description="Files deleted since startup")
+    reclaimed_bytes_total: int = Field(..., description="Bytes freed since startup")
+    current_pass: Optional[UploadGcPass] = Field(None, description="Progress of the running pass")
+    last_pass: Optional[UploadGcPass] = Field(None, description="Result of the last completed pass")
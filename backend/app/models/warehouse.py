@@ -0,0 +1,101 @@
+"""Warehouse models."""
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from enum import Enum
+
+
+class MovementType(str, Enum):
+    """Stock movement type enum."""
+    RECEIVE = "receive"
+    RESERVE = "reserve"
+    RELEASE = "release"
+
+
+class ReservationStatus(str, Enum):
+    """Reservation status enum."""
+    ACTIVE = "active"
+    RELEASED = "released"
+
+
+class MaterialBase(BaseModel):
+    """Base material model."""
+    
+    name: str = Field(..., description="Material name")
+    unit: str = Field(..., description="Unit of measure (kg, units, ...)")
+    min_stock: float = Field(..., ge=0, description="Low-stock threshold")
+    category: str = Field(..., description="Material category")
+
+
+class MaterialCreate(MaterialBase):
+    """Material creation model."""
+    
+    id: str = Field(..., description="Unique material ID")
+    quantity: float = Field(default=0, ge=0, description="Initial quantity in stock")
+
+
+class Material(MaterialBase):
+    """Material model."""
+    
+    id: str = Field(..., description="Unique material ID")
+    quantity: float = Field(..., description="Quantity available in stock")
+    low_stock: bool = Field(..., description="Whether quantity is below min_stock")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": "1",
+                "name": "Steel Sheets",
+                "quantity": 500,
+                "unit": "kg",
+                "min_stock": 200,
+                "category": "Raw Material",
+                "low_stock": False
+            }
+        }
+
+
+class StockReceipt(BaseModel):
+    """Stock receipt model."""
+    
+    quantity: float = Field(..., gt=0, description="Quantity received")
+    reference: Optional[str] = Field(None, description="Delivery note or other reference")
+
+
+class MaterialItem(BaseModel):
+    """Material quantity line of a bill."""
+    
+    material_id: str = Field(..., description="Material ID")
+    quantity: float = Field(..., gt=0, description="Requested quantity")
+
+
+class ReservationCreate(BaseModel):
+    """Reservation creation model."""
+    
+    items: List[MaterialItem] = Field(..., min_length=1, description="Bill of materials to reserve")
+    line_id: Optional[str] = Field(None, description="Production line requesting the materials")
+    requested_by: Optional[str] = Field(None, description="Line master requesting the materials")
+
+
+class Reservation(BaseModel):
+    """Reservation model."""
+    
+    id: str = Field(..., description="Unique reservation ID")
+    items: List[MaterialItem] = Field(..., description="Reserved materials")
+    line_id: Optional[str] = Field(None, description="Production line requesting the materials")
+    requested_by: Optional[str] = Field(None, description="Line master requesting the materials")
+    status: ReservationStatus = Field(default=ReservationStatus.ACTIVE, description="Reservation status")
+    created_at: datetime = Field(..., description="Timestamp when reservation was made")
+    released_at: Optional[datetime] = Field(None, description="Timestamp when reservation was released")
+
+
+class StockMovement(BaseModel):
+    """Stock ledger entry model."""
+    
+    seq: int = Field(..., description="Ledger sequence number")
+    material_id: str = Field(..., description="Material ID")
+    type: MovementType = Field(..., description="Movement type")
+    delta: float = Field(..., description="Quantity change (negative for reservations)")
+    balance: float = Field(..., description="Quantity in stock after the movement")
+    reference: Optional[str] = Field(None, description="Reservation ID or receipt reference")
+    timestamp: datetime = Field(..., description="Timestamp of the movement")
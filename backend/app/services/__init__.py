@@ -1,5 +1,35 @@
 """Services package."""
+from .audit_service import AuditService, get_audit_service
+from .document_service import DocumentService, get_document_service
 from .file_service import FileService
 from .maintenance_service import MaintenanceService, get_maintenance_service
+from .query_cache import QueryCache, get_report_query_cache
+from .sla_watchdog import SlaWatchdog, get_sla_watchdog
+from .telemetry_service import TelemetryService, get_telemetry_service
+from .timer_wheel import TimerWheel
+from .tracing import Tracer, get_tracer
+from .upload_gc import UploadReclaimer, get_upload_reclaimer
+from .warehouse_service import WarehouseService, get_warehouse_service
 
-__all__ = ["FileService", "MaintenanceService", "get_maintenance_service"]
+__all__ = [
+    "AuditService",
+    "DocumentService",
+    "FileService",
+    "MaintenanceService",
+    "QueryCache",
+    "SlaWatchdog",
+    "TelemetryService",
+    "TimerWheel",
+    "Tracer",
+    "UploadReclaimer",
+    "WarehouseService",
+    "get_audit_service",
+    "get_document_service",
+    "get_maintenance_service",
+    "get_report_query_cache",
+    "get_sla_watchdog",
+    "get_telemetry_service",
+    "get_tracer",
+    "get_upload_reclaimer",
+    "get_warehouse_service",
+]
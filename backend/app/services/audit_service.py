@@ -0,0 +1,361 @@
+"""Append-only audit log service."""
+import asyncio
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.config import (
+    AUDIT_BUFFER_SIZE,
+    AUDIT_DIR,
+    AUDIT_FLUSH_BATCH_SIZE,
+    AUDIT_FLUSH_INTERVAL_SECONDS,
+    AUDIT_SEGMENT_MAX_BYTES,
+)
+from app.models.audit import (
+    AuditAction,
+    AuditLogEntry,
+    AuditLogPage,
+    AuditModule,
+    AuditResult,
+)
+
+# Compact module codes for the in-memory index
+_MODULE_CODES = {module: code for code, module in enumerate(AuditModule)}
+
+
+class AuditService:
+    """
+    Service for recording and querying audit log entries.
+
+    Writes only append to an in-memory ring buffer. A background task
+    flushes the buffer in batches to append-only NDJSON segment files and
+    extends a compact time index (timestamp, segment, offset, module, user)
+    used by paged queries.
+    """
+
+    def __init__(
+        self,
+        audit_dir: Path = AUDIT_DIR,
+        buffer_size: int = AUDIT_BUFFER_SIZE,
+        batch_size: int = AUDIT_FLUSH_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        segment_max_bytes: int = AUDIT_SEGMENT_MAX_BYTES
+    ):
+        self._dir = audit_dir
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._segment_max_bytes = segment_max_bytes
+        self._next_id = 1
+        self.dropped = 0
+
+        # Time index (parallel arrays, sorted by timestamp)
+        self._index_ts = array("q")
+        self._index_segment = array("I")
+        self._index_offset = array("Q")
+        self._index_module = array("B")
+        self._index_user = array("I")
+        self._users: List[str] = []
+        self._user_codes: dict[str, int] = {}
+
+        self._segment = 0
+        self._segment_size = 0
+        self._start_lock = asyncio.Lock()
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Load the index from existing segments and start the flusher."""
+        async with self._start_lock:
+            if self._task is not None:
+                return
+            self._flush_lock = asyncio.Lock()
+            self._flush_event = asyncio.Event()
+            # Runs before any query or flush can touch the index
+            await asyncio.to_thread(self._load_segments)
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the flusher and write any buffered entries."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._flush_lock is not None:
+            await self.flush()
+
+    def record(
+        self,
+        user: str,
+        role: str,
+        module: AuditModule,
+        action: AuditAction,
+        target: str,
+        result: AuditResult = AuditResult.SUCCESS
+    ) -> AuditLogEntry:
+        """
+        Record an audit log entry.
+
+        The entry is only appended to the in-memory buffer; it is written
+        to disk by the background flusher.
+
+        Args:
+            user: User who performed the action
+            role: Role of the user
+            module: Module the action belongs to
+            action: Performed action
+            target: Target of the action
+            result: Result of the action
+
+        Returns:
+            Recorded audit log entry
+        """
+        entry = AuditLogEntry(
+            id=str(self._next_id),
+            date_time=datetime.now(),
+            user=user,
+            role=role,
+            module=module,
+            action=action,
+            target=target,
+            result=result,
+        )
+        self._next_id += 1
+
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(entry)
+
+        if len(self._buffer) >= self._batch_size and self._flush_event is not None:
+            self._flush_event.set()
+        return entry
+
+    async def flush(self):
+        """Write buffered entries to the current segment in one batch."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            batch = [self._buffer.popleft() for _ in range(len(self._buffer))]
+            segment, offset = self._segment, self._segment_size
+            if segment == 0 or offset >= self._segment_max_bytes:
+                segment, offset = segment + 1, 0
+            try:
+                offsets, end = await asyncio.to_thread(self._write_batch, batch, segment, offset)
+            except Exception:
+                # Put the batch back so the next flush retries it
+                self._buffer.extendleft(reversed(batch))
+                raise
+            
+            # Extend the index on the event loop, where queries read it
+            self._segment, self._segment_size = segment, end
+            for entry, entry_offset in zip(batch, offsets):
+                self._index_entry(
+                    _to_ms(entry.date_time), segment, entry_offset, entry.module, entry.user
+                )
+
+    async def query(
+        self,
+        module: Optional[AuditModule] = None,
+        user: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50
+    ) -> AuditLogPage:
+        """
+        Query audit log entries, newest first.
+
+        Args:
+            module: Filter by module
+            user: Filter by user
+            start: Only entries at or after this time
+            end: Only entries at or before this time
+            cursor: Cursor returned by the previous page
+            limit: Maximum number of entries
+
+        Returns:
+            Page of audit log entries
+        """
+        await self.start()
+        await self.flush()
+
+        lo = bisect_left(self._index_ts, _to_ms(start)) if start else 0
+        hi = bisect_right(self._index_ts, _to_ms(end)) if end else len(self._index_ts)
+        if cursor is not None:
+            hi = min(hi, max(cursor, 0))
+
+        module_code = _MODULE_CODES[module] if module else None
+        user_code = self._user_codes.get(user) if user else None
+        if user and user_code is None:
+            return AuditLogPage()
+
+        positions = []
+        for position in range(hi - 1, lo - 1, -1):
+            if module_code is not None and self._index_module[position] != module_code:
+                continue
+            if user_code is not None and self._index_user[position] != user_code:
+                continue
+            positions.append(position)
+            if len(positions) > limit:
+                break
+
+        next_cursor = None
+        if len(positions) > limit:
+            positions = positions[:limit]
+            next_cursor = positions[-1]
+
+        locations = [(self._index_segment[p], self._index_offset[p]) for p in positions]
+        items = await asyncio.to_thread(self._read_entries, locations)
+        return AuditLogPage(items=items, next_cursor=next_cursor)
+
+    def get_stats(self) -> dict:
+        """
+        Get audit log statistics.
+
+        Returns:
+            Dictionary with buffer and index sizes
+        """
+        return {
+            "buffered": len(self._buffer),
+            "dropped": self.dropped,
+            "indexed": len(self._index_ts),
+            "segments": self._segment,
+            "current_segment_bytes": self._segment_size,
+        }
+
+    async def _flush_loop(self):
+        """Flush periodically or when a full batch is buffered."""
+        while True:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep flushing on the next tick; entries written so far stay indexed
+                pass
+
+    def _segment_path(self, segment: int) -> Path:
+        """Get the path of a segment file."""
+        return self._dir / f"segment_{segment:06d}.ndjson"
+
+    def _write_batch(
+        self,
+        batch: List[AuditLogEntry],
+        segment: int,
+        offset: int
+    ) -> Tuple[List[int], int]:
+        """
+        Append a batch to a segment file.
+
+        Runs in a worker thread and does not touch the index.
+
+        Returns:
+            Tuple of (offset of each entry, segment size after the batch)
+        """
+        lines = []
+        offsets = []
+        for entry in batch:
+            line = entry.model_dump_json().encode("utf-8") + b"\n"
+            lines.append(line)
+            offsets.append(offset)
+            offset += len(line)
+
+        with open(self._segment_path(segment), "ab") as f:
+            f.write(b"".join(lines))
+
+        return offsets, offset
+
+    def _index_entry(self, ts: int, segment: int, offset: int, module: AuditModule, user: str):
+        """Append one entry to the time index."""
+        # Keep the index sorted even if the wall clock steps backwards
+        if self._index_ts and ts < self._index_ts[-1]:
+            ts = self._index_ts[-1]
+
+        user_code = self._user_codes.get(user)
+        if user_code is None:
+            user_code = len(self._users)
+            self._users.append(user)
+            self._user_codes[user] = user_code
+
+        self._index_ts.append(ts)
+        self._index_segment.append(segment)
+        self._index_offset.append(offset)
+        self._index_module.append(_MODULE_CODES[module])
+        self._index_user.append(user_code)
+
+    def _load_segments(self):
+        """Rebuild the index from segment files written by earlier runs."""
+        for index in (
+            self._index_ts, self._index_segment, self._index_offset,
+            self._index_module, self._index_user
+        ):
+            del index[:]
+        last_id = 0
+        for path in sorted(self._dir.glob("segment_*.ndjson")):
+            segment = int(path.stem.split("_")[1])
+            offset = 0
+            with open(path, "r+b") as f:
+                for line in f:
+                    try:
+                        entry = AuditLogEntry.model_validate_json(line)
+                    except ValueError:
+                        if not line.endswith(b"\n"):
+                            # Torn trailing write: cut it off so the next
+                            # flush does not append to the fragment
+                            f.truncate(offset)
+                            break
+                        # Skip a corrupt line
+                        offset += len(line)
+                        continue
+                    self._index_entry(
+                        _to_ms(entry.date_time), segment, offset, entry.module, entry.user
+                    )
+                    last_id = max(last_id, int(entry.id))
+                    offset += len(line)
+                    if not line.endswith(b"\n"):
+                        # Complete entry whose newline was not written
+                        f.write(b"\n")
+                        offset += 1
+            self._segment = segment
+            self._segment_size = offset
+        self._next_id = max(self._next_id, last_id + 1)
+
+    def _read_entries(self, locations: List[Tuple[int, int]]) -> List[AuditLogEntry]:
+        """Read entries at (segment, offset) locations from their segment files."""
+        by_segment: dict[int, List[Tuple[int, int]]] = {}
+        for order, (segment, offset) in enumerate(locations):
+            by_segment.setdefault(segment, []).append((order, offset))
+
+        entries: List[Optional[AuditLogEntry]] = [None] * len(locations)
+        for segment, wanted in by_segment.items():
+            with open(self._segment_path(segment), "rb") as f:
+                for order, offset in wanted:
+                    f.seek(offset)
+                    entries[order] = AuditLogEntry.model_validate_json(f.readline())
+        return entries
+
+
+def _to_ms(value: datetime) -> int:
+    """Convert a datetime to epoch milliseconds."""
+    return int(value.timestamp() * 1000)
+
+
+# Global service instance (singleton pattern)
+_audit_service = None
+
+
+def get_audit_service() -> AuditService:
+    """Get the global audit service instance."""
+    global _audit_service
+    if _audit_service is None:
+        _audit_service = AuditService()
+    return _audit_service
@@ -0,0 +1,270 @@
+"""Document service with background text extraction."""
+import asyncio
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from app.config import (
+    EXTRACTABLE_EXTENSIONS,
+    EXTRACTION_QUEUE_SIZE,
+    EXTRACTION_WORKERS,
+    UPLOAD_DIR,
+)
+from app.models.document import (
+    DocumentExtractionInfo,
+    DocumentMetadata,
+    DocumentSearchResult,
+    ExtractionStatus,
+)
+from app.services.text_extraction import extract_text
+
+# Words of the casefolded text kept in the search index
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class DocumentRecord:
+    """
+    Stored document metadata together with its extracted text.
+
+    Only the compressed text is kept; its words are indexed by the
+    service, so queries do not decompress every document.
+    """
+
+    __slots__ = ("metadata", "compressed_text", "text_length", "error")
+
+    def __init__(self, metadata: DocumentMetadata):
+        self.metadata = metadata
+        self.compressed_text: Optional[bytes] = None
+        self.text_length: Optional[int] = None
+        self.error: Optional[str] = None
+
+
+class DocumentService:
+    """Service for document records and content search."""
+
+    def __init__(
+        self,
+        workers: int = EXTRACTION_WORKERS,
+        queue_size: int = EXTRACTION_QUEUE_SIZE
+    ):
+        # In-memory storage (can be replaced with database)
+        self._documents: dict[str, DocumentRecord] = {}
+        # Inverted index: casefolded word -> filenames containing it
+        self._index: dict[str, set[str]] = {}
+        self._workers = workers
+        self._queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """Start the extraction process pool and queue consumers."""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._pool = ProcessPoolExecutor(max_workers=self._workers)
+        self._tasks = [
+            asyncio.create_task(self._extraction_worker())
+            for _ in range(self._workers)
+        ]
+
+    async def stop(self):
+        """Cancel queue consumers and shut down the process pool."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def add_document(self, metadata: DocumentMetadata) -> DocumentMetadata:
+        """
+        Register an uploaded document and queue it for text extraction.
+
+        The call waits for a free queue slot when the extraction backlog
+        is full, which applies backpressure to uploaders.
+
+        Args:
+            metadata: Document metadata
+
+        Returns:
+            Stored document metadata
+        """
+        record = DocumentRecord(metadata)
+        self._documents[metadata.filename] = record
+
+        if Path(metadata.filename).suffix.lower() not in EXTRACTABLE_EXTENSIONS:
+            metadata.extraction_status = ExtractionStatus.SKIPPED
+            return metadata
+
+        await self.start()
+        metadata.extraction_status = ExtractionStatus.PENDING
+        await self._queue.put(metadata.filename)
+        return metadata
+
+    def get_document(self, filename: str) -> Optional[DocumentMetadata]:
+        """
+        Get document metadata by filename.
+
+        Args:
+            filename: Stored filename
+
+        Returns:
+            Document metadata or None if not found
+        """
+        record = self._documents.get(filename)
+        return record.metadata if record else None
+
+    def get_extraction_info(self, filename: str) -> Optional[DocumentExtractionInfo]:
+        """
+        Get the text extraction state of a document.
+
+        Args:
+            filename: Stored filename
+
+        Returns:
+            Extraction info or None if not found
+        """
+        record = self._documents.get(filename)
+        if not record:
+            return None
+
+        return DocumentExtractionInfo(
+            filename=filename,
+            status=record.metadata.extraction_status,
+            text_length=record.text_length,
+            compressed_size=len(record.compressed_text) if record.compressed_text is not None else None,
+            error=record.error,
+        )
+
+    def get_text(self, filename: str) -> Optional[str]:
+        """
+        Get the extracted text of a document.
+
+        Args:
+            filename: Stored filename
+
+        Returns:
+            Extracted text or None if not available
+        """
+        record = self._documents.get(filename)
+        if not record or record.compressed_text is None:
+            return None
+        return zlib.decompress(record.compressed_text).decode("utf-8")
+
+    def search(self, query: str, limit: int = 20) -> List[DocumentSearchResult]:
+        """
+        Search extracted document text (case-insensitive).
+
+        Args:
+            query: Text to search for
+            limit: Maximum number of results
+
+        Returns:
+            Matching documents with a snippet around the first match
+        """
+        needle = query.casefold()
+        results = []
+
+        for filename in self._candidates(needle):
+            record = self._documents.get(filename)
+            if record is None or record.compressed_text is None:
+                continue
+
+            # Only candidate documents are decompressed, to confirm the match
+            text = zlib.decompress(record.compressed_text).decode("utf-8")
+            folded = text.casefold()
+            position = folded.find(needle)
+            if position == -1:
+                continue
+
+            if len(folded) != len(text):
+                # Casefolding changed the length (e.g. ß -> ss)
+                position = _unfold_offset(text, position)
+            start = max(0, position - 60)
+            end = min(len(text), position + len(query) + 60)
+            results.append(DocumentSearchResult(
+                document=record.metadata,
+                snippet=" ".join(text[start:end].split()),
+                match_count=folded.count(needle),
+            ))
+
+        # Most relevant (most matches) first
+        results.sort(key=lambda r: r.match_count, reverse=True)
+        return results[:limit]
+
+    def _candidates(self, needle: str) -> set[str]:
+        """
+        Find documents that may contain a casefolded query.
+
+        Each word of the query must be part of an indexed word of the
+        document; matches are confirmed on the decompressed text.
+        """
+        words = _TOKEN_RE.findall(needle)
+        if not words:
+            # Nothing to look up; confirm against every extracted document
+            return {name for name, record in self._documents.items() if record.compressed_text is not None}
+
+        candidates = None
+        for word in words:
+            found = set()
+            for token, filenames in self._index.items():
+                if word in token:
+                    found |= filenames
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                break
+        return candidates
+
+    async def _extraction_worker(self):
+        """Consume queued documents and extract their text in the pool."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            filename = await self._queue.get()
+            record = self._documents.get(filename)
+            try:
+                if record is None:
+                    continue
+                record.metadata.extraction_status = ExtractionStatus.PROCESSING
+                text = await loop.run_in_executor(
+                    self._pool, extract_text, str(UPLOAD_DIR / filename)
+                )
+                record.compressed_text = zlib.compress(text.encode("utf-8"))
+                for token in set(_TOKEN_RE.findall(text.casefold())):
+                    self._index.setdefault(token, set()).add(filename)
+                record.text_length = len(text)
+                record.metadata.extraction_status = ExtractionStatus.DONE
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if record is not None:
+                    record.error = str(e)
+                    record.metadata.extraction_status = ExtractionStatus.FAILED
+            finally:
+                self._queue.task_done()
+
+
+def _unfold_offset(text: str, position: int) -> int:
+    """Map an offset in text.casefold() to the offset in text."""
+    folded = 0
+    for index, char in enumerate(text):
+        if folded >= position:
+            return index
+        folded += len(char.casefold())
+    return len(text)
+
+
+# Global service instance (singleton pattern)
+_document_service = None
+
+
+def get_document_service() -> DocumentService:
+    """Get the global document service instance."""
+    global _document_service
+    if _document_service is None:
+        _document_service = DocumentService()
+    return _document_service
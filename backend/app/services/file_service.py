@@ -1,18 +1,25 @@
 """File handling service."""
+import shutil
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Tuple
 
 from fastapi import UploadFile, HTTPException
+from starlette.concurrency import run_in_threadpool
 
-from app.config import UPLOAD_DIR, ALLOWED_EXTENSIONS, MAX_FILE_SIZE
+from app.config import UPLOAD_DIR, ALLOWED_EXTENSIONS, FILE_SIGNATURES, MAX_FILE_SIZE
+from app.services.tracing import traced
+
+# Bytes read from the start of a file to check its signature
+SIGNATURE_READ_SIZE = 16
 
 
 class FileService:
     """Service for handling file operations."""
     
     @staticmethod
+    @traced
     def validate_file(file: UploadFile) -> Tuple[str, str]:
         """
         Validate uploaded file.
@@ -47,10 +54,46 @@ class FileService:
         return file_ext, content_type
     
     @staticmethod
+    @traced
+    async def validate_file_signature(file: UploadFile, file_ext: str):
+        """
+        Validate that the file content matches its extension.
+        
+        Only the first bytes of the file are read. By the time this runs
+        the whole body has been spooled; single-file upload paths are
+        already checked while streaming by UploadSignatureMiddleware, so
+        this is the authoritative check for batch uploads.
+        
+        Args:
+            file: Uploaded file
+            file_ext: File extension returned by validate_file
+            
+        Raises:
+            HTTPException: If the leading bytes do not match the file type
+        """
+        header = await file.read(SIGNATURE_READ_SIZE)
+        await file.seek(0)
+        
+        if not header:
+            raise HTTPException(status_code=400, detail="File is empty")
+        
+        signatures = FILE_SIGNATURES.get(file_ext, ())
+        if not any(header.startswith(signature) for signature in signatures):
+            raise HTTPException(
+                status_code=400,
+                detail=f"File content does not match the {file_ext} file type"
+            )
+    
+    @staticmethod
+    @traced
     async def validate_file_size(file: UploadFile) -> int:
         """
         Validate and get file size.
         
+        The size reported by the multipart parser is used when available;
+        otherwise the spooled file is measured by seeking, without reading
+        its content.
+        
         Args:
             file: Uploaded file
             
@@ -60,12 +103,11 @@ class FileService:
         Raises:
             HTTPException: If file is too large
         """
-        # Read file content to get size
-        content = await file.read()
-        file_size = len(content)
-        
-        # Reset file pointer
-        await file.seek(0)
+        file_size = file.size
+        if file_size is None:
+            position = file.file.tell()
+            file_size = file.file.seek(0, 2)
+            file.file.seek(position)
         
         if file_size > MAX_FILE_SIZE:
             max_size_mb = MAX_FILE_SIZE / (1024 * 1024)
@@ -105,10 +147,14 @@ class FileService:
         return f"{safe_base_name}_{timestamp}_{unique_id}{file_ext}"
     
     @staticmethod
+    @traced
     async def save_file(file: UploadFile, filename: str) -> Path:
         """
         Save uploaded file to disk.
         
+        The content is copied in chunks in the thread pool, so several
+        files can be written in parallel without blocking the event loop.
+        
         Args:
             file: Uploaded file
             filename: Target filename
@@ -118,14 +164,18 @@ class FileService:
         """
         file_path = UPLOAD_DIR / filename
         
+        def copy():
+            file.file.seek(0)
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(file.file, f, 1024 * 1024)
+        
         # Write file content
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
+        await run_in_threadpool(copy)
         
         return file_path
     
     @staticmethod
+    @traced
     def get_file_info(file_path: Path) -> dict:
         """
         Get file information.
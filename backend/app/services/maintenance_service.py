@@ -1,6 +1,11 @@
 """Maintenance service for business logic."""
+import heapq
+import itertools
+import threading
+from bisect import bisect_right
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
 from uuid import uuid4
 
 from app.models.maintenance import (
@@ -9,6 +14,11 @@ from app.models.maintenance import (
     FailureReportUpdate,
     MaintenanceStatus
 )
+from app.services.sla_watchdog import get_sla_watchdog
+from app.services.tracing import traced
+
+# Dispatch order of priority levels (lower is served first)
+PRIORITY_RANKS = {"urgent": 0, "high": 1, "normal": 2, "low": 3}
 
 
 class MaintenanceService:
@@ -17,7 +27,33 @@ class MaintenanceService:
     def __init__(self):
         # In-memory storage (can be replaced with database)
         self._reports: dict[str, FailureReport] = {}
+        # Incremented on every write so read caches can detect stale results
+        self._version = 0
+        # Insertion order of (seq, report_id); deleted reports stay as
+        # tombstones until compaction so lazy iterators can resume by seq
+        self._order: list[tuple[int, str]] = []
+        self._order_seq = itertools.count()
+        self._tombstones = 0
+        # Dispatch queue: heap of (priority rank, created_at, seq, report_id).
+        # Entries are invalidated lazily; _dispatch_entries maps each
+        # claimable report to the seq of its live heap entry.
+        self._dispatch_heap: list[tuple] = []
+        self._dispatch_entries: dict[str, int] = {}
+        self._dispatch_seq = itertools.count()
+        self._dispatch_lock = threading.Lock()
+        # SLA deadlines, rescheduled on every report change
+        self._sla = get_sla_watchdog()
+        # Reference counts of stored photo filenames, for the upload reclaimer
+        self._photo_refs: dict[str, int] = {}
+        # Photos detached from their last report, handed to the upload reclaimer
+        self._released_photos: set[str] = set()
+    
+    @property
+    def version(self) -> int:
+        """Store version, changes whenever a report is written."""
+        return self._version
     
+    @traced
     def create_failure_report(self, report_data: FailureReportCreate) -> FailureReport:
         """
         Create a new failure report.
@@ -43,8 +79,13 @@ class MaintenanceService:
         )
         
         self._reports[report_id] = report
+        self._order.append((next(self._order_seq), report_id))
+        self._sync_dispatch(report)
+        self._sla.track(report)
+        self._version += 1
         return report
     
+    @traced
     def get_failure_report(self, report_id: str) -> Optional[FailureReport]:
         """
         Get a failure report by ID.
@@ -57,10 +98,12 @@ class MaintenanceService:
         """
         return self._reports.get(report_id)
     
+    @traced
     def get_all_failure_reports(
         self,
         status: Optional[MaintenanceStatus] = None,
-        line_id: Optional[str] = None
+        line_id: Optional[str] = None,
+        snapshot: bool = False
     ) -> List[FailureReport]:
         """
         Get all failure reports with optional filtering.
@@ -68,6 +111,8 @@ class MaintenanceService:
         Args:
             status: Filter by status
             line_id: Filter by line ID
+            snapshot: Return copies that later writes do not change (for
+                serialization outside the event loop)
             
         Returns:
             List of failure reports
@@ -83,8 +128,67 @@ class MaintenanceService:
         # Sort by created_at descending (newest first)
         reports.sort(key=lambda x: x.created_at, reverse=True)
         
+        if snapshot:
+            reports = [
+                r.model_copy(update={"photo_urls": list(r.photo_urls)}) for r in reports
+            ]
+        
         return reports
     
+    def iter_failure_reports(
+        self,
+        status: Optional[MaintenanceStatus] = None,
+        line_id: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Iterator[FailureReport]:
+        """
+        Iterate failure reports lazily in insertion order (oldest first).
+        
+        Nothing is copied, so memory stays constant regardless of the number
+        of reports. Writes between two steps of the iteration are tolerated:
+        the iteration resumes after the insertion sequence of the last
+        visited report, so no report is skipped or repeated.
+        
+        Args:
+            status: Filter by status
+            line_id: Filter by line ID
+            created_from: Only reports created at or after this time
+            created_to: Only reports created before this time
+            
+        Yields:
+            Matching failure reports
+        """
+        order = self._order
+        index = 0
+        last_seq = -1
+        
+        while True:
+            if order is not self._order:
+                # Compacted since the last step; find the resume position
+                order = self._order
+                index = bisect_right(order, last_seq, key=lambda entry: entry[0])
+            if index >= len(order):
+                return
+            last_seq, report_id = order[index]
+            index += 1
+            
+            report = self._reports.get(report_id)
+            if report is None:
+                continue
+            # Not an early exit: the wall clock may step back between
+            # inserts, so creation times are not ordered by sequence
+            if created_to and report.created_at >= created_to:
+                continue
+            if created_from and report.created_at < created_from:
+                continue
+            if status and report.status != status:
+                continue
+            if line_id and report.line_id != line_id:
+                continue
+            yield report
+    
+    @traced
     def update_failure_report(
         self,
         report_id: str,
@@ -106,11 +210,16 @@ class MaintenanceService:
         
         # Update fields
         update_dict = update_data.model_dump(exclude_unset=True)
+        old_photo_urls = list(report.photo_urls)
         
         for key, value in update_dict.items():
             if hasattr(report, key) and value is not None:
                 setattr(report, key, value)
         
+        if report.photo_urls != old_photo_urls:
+            self._ref_photos(old_photo_urls, -1)
+            self._ref_photos(report.photo_urls, 1)
+        
         # Handle status transitions
         if update_data.status:
             self._handle_status_transition(report, update_data.status)
@@ -121,6 +230,9 @@ class MaintenanceService:
                 duration = report.completed_at - report.start_time
                 report.total_duration_minutes = int(duration.total_seconds() / 60)
         
+        self._sync_dispatch(report)
+        self._sla.track(report)
+        self._version += 1
         return report
     
     def _handle_status_transition(
@@ -153,6 +265,7 @@ class MaintenanceService:
         
         report.status = new_status
     
+    @traced
     def mark_worker_arrived(self, report_id: str) -> Optional[FailureReport]:
         """
         Mark that maintenance worker has arrived.
@@ -176,8 +289,12 @@ class MaintenanceService:
             if not report.start_time:
                 report.start_time = datetime.now()
         
+        self._sync_dispatch(report)
+        self._sla.track(report)
+        self._version += 1
         return report
     
+    @traced
     def add_photo_to_report(
         self,
         report_id: str,
@@ -199,9 +316,40 @@ class MaintenanceService:
         
         if photo_url not in report.photo_urls:
             report.photo_urls.append(photo_url)
+            self._ref_photos([photo_url], 1)
+            self._version += 1
         
         return report
     
+    @traced
+    def add_photos_to_report(
+        self,
+        report_id: str,
+        photo_urls: List[str]
+    ) -> Optional[FailureReport]:
+        """
+        Add several photo URLs to a failure report in one update.
+        
+        Args:
+            report_id: Failure report ID
+            photo_urls: URLs of uploaded photos
+            
+        Returns:
+            Updated failure report or None if not found
+        """
+        report = self._reports.get(report_id)
+        if not report:
+            return None
+        
+        new_urls = [url for url in dict.fromkeys(photo_urls) if url not in report.photo_urls]
+        if new_urls:
+            report.photo_urls.extend(new_urls)
+            self._ref_photos(new_urls, 1)
+            self._version += 1
+        
+        return report
+    
+    @traced
     def delete_failure_report(self, report_id: str) -> bool:
         """
         Delete a failure report.
@@ -213,9 +361,140 @@ class MaintenanceService:
             True if deleted, False if not found
         """
         if report_id in self._reports:
-            del self._reports[report_id]
+            report = self._reports.pop(report_id)
+            # Photos become orphans and are removed by the upload reclaimer
+            self._ref_photos(report.photo_urls, -1)
+            with self._dispatch_lock:
+                self._dispatch_entries.pop(report_id, None)
+            self._sla.forget(report_id)
+            self._compact_order()
+            self._version += 1
             return True
         return False
+    
+    def references_file(self, filename: str) -> bool:
+        """
+        Check whether any failure report references a stored file.
+        
+        Args:
+            filename: Filename in the upload directory
+            
+        Returns:
+            True if the file is a photo of a report
+        """
+        return filename in self._photo_refs
+    
+    def pop_released_photos(self) -> set[str]:
+        """
+        Take the photos detached from their last report since the last call.
+        
+        Returns:
+            Filenames that a report of this process referenced and no
+            report references any more
+        """
+        released, self._released_photos = self._released_photos, set()
+        return released
+    
+    @traced
+    def claim_next_report(self, worker: str) -> Optional[FailureReport]:
+        """
+        Claim the highest-priority, oldest open report for a worker.
+        
+        The report is assigned to the worker and moved to IN_PROGRESS in
+        the same locked step, so a report is never claimed twice.
+        
+        Args:
+            worker: Maintenance worker claiming the report
+            
+        Returns:
+            Claimed failure report or None if nothing is open
+        """
+        with self._dispatch_lock:
+            while self._dispatch_heap:
+                _, _, seq, report_id = heapq.heappop(self._dispatch_heap)
+                if self._dispatch_entries.get(report_id) != seq:
+                    # Stale entry (claimed, closed, re-queued or deleted)
+                    continue
+                del self._dispatch_entries[report_id]
+                
+                report = self._reports.get(report_id)
+                if not report or report.status != MaintenanceStatus.OPEN or report.assigned_to:
+                    continue
+                
+                report.assigned_to = worker
+                self._handle_status_transition(report, MaintenanceStatus.IN_PROGRESS)
+                self._sla.track(report)
+                self._version += 1
+                return report
+        
+        return None
+    
+    def get_dispatch_queue_size(self) -> int:
+        """
+        Get the number of reports waiting in the dispatch queue.
+        
+        Returns:
+            Number of claimable open reports
+        """
+        return len(self._dispatch_entries)
+    
+    def _compact_order(self):
+        """
+        Count a deleted report and drop tombstones once they dominate.
+        
+        The list is replaced rather than modified, so running iterators
+        notice the compaction and re-locate their position.
+        """
+        self._tombstones += 1
+        if self._tombstones > 64 and self._tombstones * 2 > len(self._order):
+            self._order = [entry for entry in self._order if entry[1] in self._reports]
+            self._tombstones = 0
+    
+    def _ref_photos(self, photo_urls: Iterable[str], delta: int):
+        """
+        Adjust the reference counts of photo files.
+        
+        Args:
+            photo_urls: Photo URLs (only the filename part is counted)
+            delta: +1 when URLs are attached, -1 when they are removed
+        """
+        for url in photo_urls:
+            name = Path(url).name
+            count = self._photo_refs.get(name, 0) + delta
+            if count > 0:
+                self._photo_refs[name] = count
+                self._released_photos.discard(name)
+            elif self._photo_refs.pop(name, None) is not None:
+                self._released_photos.add(name)
+    
+    def _sync_dispatch(self, report: FailureReport):
+        """
+        Keep the dispatch queue in sync with a report's status.
+        
+        Open, unassigned reports get a heap entry; any other report loses
+        its entry, which is then skipped when popped.
+        
+        Args:
+            report: Failure report that was created or changed
+        """
+        claimable = report.status == MaintenanceStatus.OPEN and not report.assigned_to
+        
+        with self._dispatch_lock:
+            if not claimable:
+                self._dispatch_entries.pop(report.id, None)
+            elif report.id not in self._dispatch_entries:
+                seq = next(self._dispatch_seq)
+                rank = PRIORITY_RANKS.get((report.priority or "normal").lower(), PRIORITY_RANKS["normal"])
+                heapq.heappush(self._dispatch_heap, (rank, report.created_at, seq, report.id))
+                self._dispatch_entries[report.id] = seq
+            
+            # Compact when stale entries dominate the heap
+            if len(self._dispatch_heap) > 2 * len(self._dispatch_entries) + 64:
+                self._dispatch_heap = [
+                    entry for entry in self._dispatch_heap
+                    if self._dispatch_entries.get(entry[3]) == entry[2]
+                ]
+                heapq.heapify(self._dispatch_heap)
 
 
 # Global service instance (singleton pattern)
@@ -0,0 +1,169 @@
+"""Read-side query cache with single-flight request coalescing."""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app.config import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_TTL_SECONDS
+from app.services.maintenance_service import get_maintenance_service
+
+
+class QueryCache:
+    """
+    Small LRU cache with a short TTL for hot read queries.
+
+    Entries are keyed by the query parameters and the store version, so
+    any write to the store invalidates all cached results. Identical
+    queries that arrive while a computation is running await the same
+    in-flight result instead of repeating the work.
+    """
+
+    def __init__(
+        self,
+        version_source: Callable[[], int],
+        max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = QUERY_CACHE_TTL_SECONDS
+    ):
+        self._version_source = version_source
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[Tuple[int, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._version = None
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[Any], Any],
+        snapshot: Callable[[], Any] = lambda: None
+    ) -> Any:
+        """
+        Return a cached result or compute it once for all concurrent callers.
+
+        ``snapshot`` runs on the event loop, where the store is written, and
+        must return a copy of the data ``compute`` needs; ``compute`` then
+        works only on that copy in the thread pool, so a result never mixes
+        old and new values of a report. If the caller computing a result is
+        cancelled, one of the callers waiting for it takes over.
+
+        Args:
+            key: Hashable query key (parameters only, version is added)
+            compute: Synchronous function turning the snapshot into the
+                result; it runs in the thread pool so concurrent callers can
+                coalesce on it
+            snapshot: Function copying the queried data from the store
+
+        Returns:
+            Query result
+        """
+        coalesced = False
+        while True:
+            version = self._version_source()
+            if version != self._version:
+                self._invalidate(version)
+
+            full_key = (version, key)
+            entry = self._entries.get(full_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(full_key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[full_key]
+
+            future = self._in_flight.get(full_key)
+            if future is None:
+                break
+            if not coalesced:
+                self.coalesced += 1
+                coalesced = True
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # This caller was cancelled, not the computation
+                    raise
+                # The computing caller was cancelled; retry and take over
+
+        if not coalesced:
+            self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        # Mark failures as retrieved when nobody else is waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._in_flight[full_key] = future
+
+        try:
+            data = snapshot()
+            value = await run_in_threadpool(compute, data)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._in_flight.pop(full_key, None)
+
+        future.set_result(value)
+        # Do not cache results computed across a write
+        if self._version_source() == version:
+            self._store(full_key, value)
+        return value
+
+    def get_stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hit/miss/coalesced counters and cache size
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+        }
+
+    def _invalidate(self, version: int):
+        """Drop entries computed against an older store version."""
+        if self._entries:
+            self.invalidations += 1
+            self._entries.clear()
+        self._version = version
+
+    def _store(self, full_key: Tuple[int, Hashable], value: Any):
+        """Insert an entry, evicting the least recently used ones."""
+        self._entries[full_key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(full_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Global cache instance for failure report queries (singleton pattern)
+_report_query_cache = None
+
+
+def get_report_query_cache() -> QueryCache:
+    """Get the global failure report query cache."""
+    global _report_query_cache
+    if _report_query_cache is None:
+        service = get_maintenance_service()
+        _report_query_cache = QueryCache(version_source=lambda: service.version)
+    return _report_query_cache
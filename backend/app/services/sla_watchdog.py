@@ -0,0 +1,237 @@
+"""SLA watchdog for overdue failure reports."""
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from app.config import (
+    SLA_ARRIVAL_MINUTES,
+    SLA_BREACH_HISTORY,
+    SLA_EVENT_QUEUE_SIZE,
+    SLA_REPAIR_MINUTES,
+    SLA_TICK_SECONDS,
+)
+from app.models.maintenance import FailureReport, MaintenanceStatus, SlaBreach, SlaKind
+from app.services.timer_wheel import TimerWheel
+
+
+class SlaWatchdog:
+    """
+    Tracks SLA deadlines of failure reports on a hierarchical timer wheel.
+
+    Two deadlines exist per report: worker arrival (from creation) and
+    repair duration (from the start of work). The maintenance service calls
+    ``track`` whenever a report changes, which schedules, moves or cancels
+    its deadlines in O(1). A background task advances the wheel every tick
+    and only touches the deadlines that expire. Breaches are kept while the
+    report stays overdue and are published to event subscribers when they
+    occur and when they are resolved.
+    """
+
+    def __init__(
+        self,
+        arrival_minutes: Dict[str, int] = SLA_ARRIVAL_MINUTES,
+        repair_minutes: Dict[str, int] = SLA_REPAIR_MINUTES,
+        tick_seconds: float = SLA_TICK_SECONDS,
+        history_size: int = SLA_BREACH_HISTORY
+    ):
+        self._minutes = {SlaKind.ARRIVAL: arrival_minutes, SlaKind.REPAIR: repair_minutes}
+        self._tick_seconds = tick_seconds
+        self._wheel = TimerWheel(tick_seconds, now=time.time())
+        self._active: Dict[Tuple[str, SlaKind], SlaBreach] = {}
+        self._history: deque = deque(maxlen=history_size)
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.breaches_total = 0
+        self.events_dropped = 0
+
+    async def start(self):
+        """Start advancing the timer wheel."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._tick_loop())
+
+    async def stop(self):
+        """Stop advancing the timer wheel."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def track(self, report: FailureReport):
+        """
+        Bring a report's deadlines in line with its current state.
+
+        Deadlines that no longer apply are cancelled and any breach of them
+        is resolved; deadlines that apply and have not been missed yet are
+        (re)scheduled.
+
+        Args:
+            report: Failure report that was created or changed
+        """
+        for kind in SlaKind:
+            key = (report.id, kind)
+            deadline = self._deadline(report, kind)
+            if deadline is None:
+                self._wheel.cancel(key)
+                self._resolve(key)
+            elif key not in self._active:
+                self._wheel.schedule(key, deadline.timestamp(), report)
+
+    def forget(self, report_id: str):
+        """
+        Drop the deadlines and breaches of a deleted report.
+
+        Args:
+            report_id: Failure report ID
+        """
+        for kind in SlaKind:
+            key = (report_id, kind)
+            self._wheel.cancel(key)
+            self._resolve(key)
+
+    def tick(self, now: Optional[float] = None) -> List[SlaBreach]:
+        """
+        Advance the timer wheel and record expired deadlines as breaches.
+
+        Args:
+            now: Current epoch time in seconds (defaults to the wall clock)
+
+        Returns:
+            Newly detected breaches
+        """
+        breached_at = datetime.now()
+        breaches = []
+
+        for key, _, report in self._wheel.advance(time.time() if now is None else now):
+            deadline = self._deadline(report, key[1])
+            if deadline is None:
+                continue
+            breach = SlaBreach(
+                report_id=report.id,
+                line_id=report.line_id,
+                line_name=report.line_name,
+                priority=report.priority or "normal",
+                kind=key[1],
+                deadline=deadline,
+                breached_at=breached_at,
+            )
+            self._active[key] = breach
+            self._history.append(breach)
+            self.breaches_total += 1
+            self._publish(breach)
+            breaches.append(breach)
+
+        return breaches
+
+    def get_breaches(
+        self,
+        active_only: bool = True,
+        kind: Optional[SlaKind] = None,
+        limit: int = 100
+    ) -> List[SlaBreach]:
+        """
+        Get SLA breaches, newest first.
+
+        Args:
+            active_only: Only breaches of reports that are still overdue
+            kind: Filter by deadline kind
+            limit: Maximum number of breaches
+
+        Returns:
+            List of SLA breaches
+        """
+        source = self._active.values() if active_only else self._history
+        breaches = [b for b in source if kind is None or b.kind == kind]
+        breaches.sort(key=lambda b: b.breached_at, reverse=True)
+        return breaches[:limit]
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Subscribe to breach and resolution events.
+
+        Returns:
+            Queue receiving SlaBreach events (resolved ones have resolved_at set)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SLA_EVENT_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """
+        Remove an event subscription.
+
+        Args:
+            queue: Queue returned by subscribe
+        """
+        self._subscribers.discard(queue)
+
+    def get_stats(self) -> dict:
+        """
+        Get watchdog statistics.
+
+        Returns:
+            Dictionary with deadline, breach and subscriber counts
+        """
+        return {
+            "scheduled": len(self._wheel),
+            "active_breaches": len(self._active),
+            "breaches_total": self.breaches_total,
+            "subscribers": len(self._subscribers),
+            "events_dropped": self.events_dropped,
+            "tick_seconds": self._tick_seconds,
+        }
+
+    async def _tick_loop(self):
+        """Advance the wheel once per tick."""
+        while True:
+            await asyncio.sleep(self._tick_seconds)
+            try:
+                self.tick()
+            except Exception:
+                # Keep the watchdog running; the next tick retries
+                pass
+
+    def _deadline(self, report: FailureReport, kind: SlaKind) -> Optional[datetime]:
+        """Get the deadline of a report, or None if it does not apply."""
+        minutes = self._minutes[kind].get((report.priority or "normal").lower())
+        if not minutes:
+            return None
+
+        if kind == SlaKind.ARRIVAL:
+            if report.worker_arrived_at or report.status == MaintenanceStatus.CLOSED:
+                return None
+            return report.created_at + timedelta(minutes=minutes)
+
+        if report.status != MaintenanceStatus.IN_PROGRESS or not report.start_time:
+            return None
+        return report.start_time + timedelta(minutes=minutes)
+
+    def _resolve(self, key: Tuple[str, SlaKind]):
+        """Close an active breach and publish its resolution."""
+        breach = self._active.pop(key, None)
+        if breach is not None:
+            breach.resolved_at = datetime.now()
+            self._publish(breach)
+
+    def _publish(self, breach: SlaBreach):
+        """Send an event to all subscribers without blocking."""
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(breach.model_copy())
+            except asyncio.QueueFull:
+                self.events_dropped += 1
+
+
+# Global service instance (singleton pattern)
+_sla_watchdog = None
+
+
+def get_sla_watchdog() -> SlaWatchdog:
+    """Get the global SLA watchdog instance."""
+    global _sla_watchdog
+    if _sla_watchdog is None:
+        _sla_watchdog = SlaWatchdog()
+    return _sla_watchdog
@@ -0,0 +1,362 @@
+"""Production line telemetry service."""
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.config import (
+    TELEMETRY_HOUR_CAPACITY,
+    TELEMETRY_MAX_LINES,
+    TELEMETRY_MINUTE_CAPACITY,
+    TELEMETRY_RAW_CAPACITY,
+)
+from app.models.telemetry import (
+    LineStatus,
+    LineTelemetrySummary,
+    TelemetryIngestResult,
+    TelemetryPoint,
+    TelemetryResolution,
+    TelemetrySample,
+    TelemetrySeries,
+)
+
+# Compact status codes stored in the ring buffers
+_STATUSES = list(LineStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+# Bucket width in seconds per downsampled tier
+_MINUTE = 60
+_HOUR = 3600
+
+
+class RingSeries:
+    """
+    Fixed-size, array-backed ring buffer of telemetry points.
+
+    Columns are preallocated ``array`` objects, so memory does not grow
+    after construction. Points must be appended in timestamp order.
+    """
+
+    __slots__ = (
+        "capacity", "size", "head",
+        "ts", "efficiency", "efficiency_min", "efficiency_max", "output", "status", "count",
+    )
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.size = 0
+        self.head = 0  # physical index of the next write
+        self.ts = array("d", bytes(8 * capacity))
+        self.efficiency = array("d", bytes(8 * capacity))
+        self.efficiency_min = array("d", bytes(8 * capacity))
+        self.efficiency_max = array("d", bytes(8 * capacity))
+        self.output = array("d", bytes(8 * capacity))
+        self.status = array("B", bytes(capacity))
+        self.count = array("I", bytes(4 * capacity))
+
+    def append(
+        self,
+        ts: float,
+        efficiency: float,
+        efficiency_min: float,
+        efficiency_max: float,
+        output: float,
+        status: int,
+        count: int
+    ):
+        """Append a point, overwriting the oldest one when full."""
+        i = self.head
+        self.ts[i] = ts
+        self.efficiency[i] = efficiency
+        self.efficiency_min[i] = efficiency_min
+        self.efficiency_max[i] = efficiency_max
+        self.output[i] = output
+        self.status[i] = status
+        self.count[i] = count
+        self.head = (i + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> float:
+        """Timestamp of the logical (oldest-first) index, for bisect."""
+        return self.ts[self._physical(index)]
+
+    def window(self, start: float, end: float, limit: int) -> List[TelemetryPoint]:
+        """
+        Get points with start <= timestamp <= end, oldest first.
+
+        The window bounds are found by binary search over the ring, so only
+        the returned points are visited. When more than ``limit`` points
+        match, the most recent ones are returned.
+        """
+        lo = bisect_left(self, start)
+        hi = bisect_right(self, end)
+        lo = max(lo, hi - limit)
+
+        points = []
+        for index in range(lo, hi):
+            i = self._physical(index)
+            points.append(TelemetryPoint(
+                timestamp=datetime.fromtimestamp(self.ts[i]),
+                efficiency=round(self.efficiency[i], 3),
+                efficiency_min=self.efficiency_min[i],
+                efficiency_max=self.efficiency_max[i],
+                output=round(self.output[i], 3),
+                status=_STATUSES[self.status[i]],
+                samples=self.count[i],
+            ))
+        return points
+
+    def _physical(self, index: int) -> int:
+        """Map a logical index (0 = oldest) to a physical slot."""
+        return (self.head - self.size + index) % self.capacity
+
+
+class _Bucket:
+    """Running aggregate of the samples in one downsampling bucket."""
+
+    __slots__ = ("start", "efficiency_sum", "efficiency_min", "efficiency_max", "output_sum", "status", "count")
+
+    def __init__(self, start: float):
+        self.start = start
+        self.efficiency_sum = 0.0
+        self.efficiency_min = float("inf")
+        self.efficiency_max = float("-inf")
+        self.output_sum = 0.0
+        self.status = 0
+        self.count = 0
+
+    def add(self, efficiency_sum: float, efficiency_min: float, efficiency_max: float,
+            output_sum: float, status: int, count: int):
+        self.efficiency_sum += efficiency_sum
+        self.efficiency_min = min(self.efficiency_min, efficiency_min)
+        self.efficiency_max = max(self.efficiency_max, efficiency_max)
+        self.output_sum += output_sum
+        self.status = status
+        self.count += count
+
+    def flush_to(self, series: RingSeries):
+        series.append(
+            self.start,
+            self.efficiency_sum / self.count,
+            self.efficiency_min,
+            self.efficiency_max,
+            self.output_sum / self.count,
+            self.status,
+            self.count,
+        )
+
+
+class LineTelemetry:
+    """Raw samples plus minute and hour tiers of one production line."""
+
+    def __init__(self, line_id: str):
+        self.line_id = line_id
+        self.raw = RingSeries(TELEMETRY_RAW_CAPACITY)
+        self.minutes = RingSeries(TELEMETRY_MINUTE_CAPACITY)
+        self.hours = RingSeries(TELEMETRY_HOUR_CAPACITY)
+        self._minute: Optional[_Bucket] = None
+        self._hour: Optional[_Bucket] = None
+        self.last_ts = float("-inf")
+        self.samples_total = 0
+
+    def add(self, ts: float, efficiency: float, output: float, status: int) -> bool:
+        """
+        Add a sample and roll completed buckets into the downsampled tiers.
+
+        Returns:
+            False if the sample is older than the latest accepted one
+        """
+        if ts < self.last_ts:
+            return False
+        self.last_ts = ts
+        self.samples_total += 1
+
+        self.raw.append(ts, efficiency, efficiency, efficiency, output, status, 1)
+
+        minute_start = ts - ts % _MINUTE
+        if self._minute is None or minute_start > self._minute.start:
+            self._close_minute()
+            self._close_hour(minute_start)
+            self._minute = _Bucket(minute_start)
+        self._minute.add(efficiency, efficiency, efficiency, output, status, 1)
+        return True
+
+    def series(self, resolution: TelemetryResolution, start: float, end: float, limit: int) -> List[TelemetryPoint]:
+        """Get a window of points at the given resolution."""
+        if resolution == TelemetryResolution.RAW:
+            return self.raw.window(start, end, limit)
+
+        if resolution == TelemetryResolution.MINUTE:
+            points = self.minutes.window(start, end, limit)
+            current = self._minute
+        else:
+            points = self.hours.window(start, end, limit)
+            current = self._hour_with_open_minute()
+
+        # Include the still open bucket as the latest (partial) point
+        if current is not None and current.count and start <= current.start <= end:
+            points.append(_bucket_point(current))
+            points = points[-limit:]
+        return points
+
+    def _close_minute(self):
+        """Flush the open minute bucket and fold it into the hour bucket."""
+        minute = self._minute
+        if minute is None or not minute.count:
+            return
+        minute.flush_to(self.minutes)
+
+        if self._hour is None:
+            self._hour = _Bucket(minute.start - minute.start % _HOUR)
+        self._hour.add(
+            minute.efficiency_sum, minute.efficiency_min, minute.efficiency_max,
+            minute.output_sum, minute.status, minute.count,
+        )
+
+    def _close_hour(self, ts: float):
+        """Flush the hour bucket once a sample of a later hour arrives."""
+        hour = self._hour
+        if hour is None or ts - ts % _HOUR <= hour.start:
+            return
+        if hour.count:
+            hour.flush_to(self.hours)
+        self._hour = None
+
+    def _hour_with_open_minute(self) -> Optional[_Bucket]:
+        """Hour bucket including the samples of the still open minute."""
+        minute = self._minute
+        if minute is None or not minute.count:
+            return self._hour
+
+        hour_start = minute.start - minute.start % _HOUR
+        merged = _Bucket(hour_start)
+        if self._hour is not None and self._hour.start == hour_start:
+            hour = self._hour
+            merged.add(hour.efficiency_sum, hour.efficiency_min, hour.efficiency_max,
+                       hour.output_sum, hour.status, hour.count)
+        merged.add(minute.efficiency_sum, minute.efficiency_min, minute.efficiency_max,
+                   minute.output_sum, minute.status, minute.count)
+        return merged
+
+
+class TelemetryService:
+    """Service for ingesting and querying production line telemetry."""
+
+    def __init__(self, max_lines: int = TELEMETRY_MAX_LINES):
+        # In-memory storage, bounded by the number of lines
+        self._lines: Dict[str, LineTelemetry] = {}
+        self._max_lines = max_lines
+
+    def ingest(self, samples: List[TelemetrySample]) -> TelemetryIngestResult:
+        """
+        Ingest a batch of telemetry samples.
+
+        Samples without a timestamp get the receive time. Samples older than
+        the latest one of their line are dropped, as are samples of new
+        lines once the line limit is reached.
+
+        Args:
+            samples: Telemetry samples
+
+        Returns:
+            Number of accepted and rejected samples
+        """
+        received_at = datetime.now().timestamp()
+        accepted = 0
+
+        for sample in samples:
+            line = self._lines.get(sample.line_id)
+            if line is None:
+                if len(self._lines) >= self._max_lines:
+                    continue
+                line = self._lines[sample.line_id] = LineTelemetry(sample.line_id)
+
+            ts = sample.timestamp.timestamp() if sample.timestamp else received_at
+            if line.add(ts, sample.efficiency, sample.output, _STATUS_CODES[sample.status]):
+                accepted += 1
+
+        return TelemetryIngestResult(accepted=accepted, rejected=len(samples) - accepted)
+
+    def get_summaries(self) -> List[LineTelemetrySummary]:
+        """
+        Get the latest telemetry values of all lines.
+
+        Returns:
+            List of line summaries
+        """
+        summaries = []
+        for line in self._lines.values():
+            latest = line.raw.window(line.last_ts, line.last_ts, 1)[-1]
+            summaries.append(LineTelemetrySummary(
+                line_id=line.line_id,
+                status=latest.status,
+                efficiency=latest.efficiency,
+                output=latest.output,
+                last_sample_at=latest.timestamp,
+                samples_total=line.samples_total,
+            ))
+        return summaries
+
+    def get_series(
+        self,
+        line_id: str,
+        resolution: TelemetryResolution = TelemetryResolution.MINUTE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 1000
+    ) -> Optional[TelemetrySeries]:
+        """
+        Get a time window of a line's telemetry at a chosen resolution.
+
+        Minute and hour queries read only the downsampled tiers.
+
+        Args:
+            line_id: Production line ID
+            resolution: raw, minute or hour
+            start: Window start (defaults to the oldest point)
+            end: Window end (defaults to now)
+            limit: Maximum number of points (most recent kept)
+
+        Returns:
+            Telemetry series or None if the line has no telemetry
+        """
+        line = self._lines.get(line_id)
+        if line is None:
+            return None
+
+        points = line.series(
+            resolution,
+            start.timestamp() if start else float("-inf"),
+            end.timestamp() if end else float("inf"),
+            limit,
+        )
+        return TelemetrySeries(line_id=line_id, resolution=resolution, points=points)
+
+
+def _bucket_point(bucket: _Bucket) -> TelemetryPoint:
+    """Convert an open bucket to a telemetry point."""
+    return TelemetryPoint(
+        timestamp=datetime.fromtimestamp(bucket.start),
+        efficiency=round(bucket.efficiency_sum / bucket.count, 3),
+        efficiency_min=bucket.efficiency_min,
+        efficiency_max=bucket.efficiency_max,
+        output=round(bucket.output_sum / bucket.count, 3),
+        status=_STATUSES[bucket.status],
+        samples=bucket.count,
+    )
+
+
+# Global service instance (singleton pattern)
+_telemetry_service = None
+
+
+def get_telemetry_service() -> TelemetryService:
+    """Get the global telemetry service instance."""
+    global _telemetry_service
+    if _telemetry_service is None:
+        _telemetry_service = TelemetryService()
+    return _telemetry_service
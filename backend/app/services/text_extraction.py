@@ -0,0 +1,280 @@
+"""Plain text extraction for uploaded documents.
+
+The functions in this module are top-level and free of shared state so they
+can be executed inside a process pool.
+"""
+import re
+import zipfile
+import zlib
+from pathlib import Path
+from xml.etree import ElementTree
+
+# WordprocessingML namespace used in word/document.xml
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Start of a PDF stream body (the "endstream" keyword is excluded)
+_PDF_STREAM_RE = re.compile(rb"(?<!end)stream\r?\n")
+
+# Text showing tokens inside a content stream: the start of a literal string
+# (scanned separately, literals may nest parentheses), hex strings, TJ arrays
+# with their kerning numbers and the operators that affect layout
+_PDF_TOKEN_RE = re.compile(
+    rb"\(|<[0-9A-Fa-f\s]*>|\[|\]|-?\d*\.?\d+|T\*|Tj|TJ|Td|TD|Tm|'|\"|BT|ET"
+)
+
+# TJ kerning adjustment (thousandths of an em) treated as a word gap
+_PDF_WORD_GAP = 200
+
+_PDF_ESCAPES = {
+    ord("n"): b"\n",
+    ord("r"): b"\r",
+    ord("t"): b"\t",
+    ord("b"): b"\b",
+    ord("f"): b"\f",
+    ord("("): b"(",
+    ord(")"): b")",
+    ord("\\"): b"\\",
+}
+
+
+def extract_text(file_path: str) -> str:
+    """
+    Extract plain text from a document based on its extension.
+
+    Args:
+        file_path: Path to the stored document
+
+    Returns:
+        Extracted plain text
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    suffix = Path(file_path).suffix.lower()
+    if suffix == ".docx":
+        return extract_docx_text(file_path)
+    if suffix == ".pdf":
+        return extract_pdf_text(file_path)
+    raise ValueError(f"Text extraction not supported for {suffix} files")
+
+
+def extract_docx_text(file_path: str) -> str:
+    """
+    Extract text from a DOCX file by reading word/document.xml.
+
+    Args:
+        file_path: Path to the DOCX file
+
+    Returns:
+        Extracted text, one line per paragraph
+    """
+    paragraphs = []
+    current = []
+
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open("word/document.xml") as xml_file:
+            for event, element in ElementTree.iterparse(xml_file, events=("end",)):
+                tag = element.tag
+                if tag == f"{_W_NS}t":
+                    current.append(element.text or "")
+                elif tag == f"{_W_NS}tab":
+                    current.append("\t")
+                elif tag in (f"{_W_NS}br", f"{_W_NS}cr"):
+                    current.append("\n")
+                elif tag == f"{_W_NS}p":
+                    paragraphs.append("".join(current))
+                    current = []
+                    # Drop the finished paragraph subtree to keep memory flat
+                    element.clear()
+
+    if current:
+        paragraphs.append("".join(current))
+
+    return "\n".join(paragraphs).strip()
+
+
+def extract_pdf_text(file_path: str) -> str:
+    """
+    Extract text from a PDF file without external dependencies.
+
+    Content streams are inflated with zlib when FlateDecode is used and the
+    text showing operators (Tj, TJ, ', ") are decoded. Fonts with custom
+    CID encodings are not mapped, so such documents may yield partial text.
+
+    Args:
+        file_path: Path to the PDF file
+
+    Returns:
+        Extracted text
+    """
+    data = Path(file_path).read_bytes()
+    chunks = []
+
+    for match in _PDF_STREAM_RE.finditer(data):
+        # The stream dictionary sits between "obj" and the stream keyword
+        header = data[data.rfind(b"obj", 0, match.start()):match.start()]
+        start = match.end()
+        end = data.find(b"endstream", start)
+        if end == -1:
+            break
+
+        # Skip images, fonts and other binary payloads
+        if b"/Subtype" in header or b"/Length1" in header:
+            continue
+
+        raw = data[start:end].rstrip(b"\r\n")
+        if b"/FlateDecode" in header:
+            try:
+                raw = zlib.decompressobj().decompress(raw)
+            except zlib.error:
+                continue
+        elif b"/Filter" in header:
+            # Other filters (DCT, LZW, ...) never carry plain text operators
+            continue
+
+        text = _parse_content_stream(raw)
+        if text:
+            chunks.append(text)
+
+    return "\n".join(chunks).strip()
+
+
+def _parse_content_stream(stream: bytes) -> str:
+    """Decode the text showing operators of a single content stream."""
+    lines = []
+    line = []
+    operands = []
+    in_text = False
+    in_array = False
+
+    for token in _tokenize(stream):
+        if token == b"BT":
+            in_text = True
+            operands = []
+        elif token == b"ET":
+            in_text = False
+            if line:
+                lines.append("".join(line))
+                line = []
+        elif not in_text:
+            continue
+        elif token == b"[":
+            in_array = True
+        elif token == b"]":
+            in_array = False
+        elif token[:1] in b"-.0123456789":
+            if in_array and -float(token) >= _PDF_WORD_GAP:
+                operands.append(" ")
+        elif token.startswith(b"("):
+            operands.append(_decode_literal(token[1:-1]))
+        elif token.startswith(b"<"):
+            operands.append(_decode_hex(token[1:-1]))
+        elif token in (b"Tj", b"TJ"):
+            line.append("".join(operands))
+            operands = []
+        elif token in (b"'", b'"'):
+            if line:
+                lines.append("".join(line))
+            line = ["".join(operands)]
+            operands = []
+        elif token in (b"T*", b"Td", b"TD", b"Tm"):
+            if line:
+                lines.append("".join(line))
+                line = []
+            operands = []
+
+    if line:
+        lines.append("".join(line))
+
+    return "\n".join(l for l in lines if l.strip())
+
+
+def _tokenize(stream: bytes):
+    """Yield the tokens of a content stream, literal strings included whole."""
+    position = 0
+    while True:
+        match = _PDF_TOKEN_RE.search(stream, position)
+        if not match:
+            return
+        if match.group() == b"(":
+            end = _literal_end(stream, match.start())
+            yield stream[match.start():end]
+            position = end
+        else:
+            yield match.group()
+            position = match.end()
+
+
+def _literal_end(stream: bytes, start: int) -> int:
+    """
+    Find the end of the literal string opening at ``start``.
+
+    Unescaped parentheses inside a literal must be balanced, so they are
+    tracked with a depth counter.
+
+    Returns:
+        Index just past the closing parenthesis (or the end of the stream)
+    """
+    depth = 0
+    i = start
+    length = len(stream)
+    while i < length:
+        byte = stream[i]
+        if byte == 0x5C:  # backslash escapes the next byte
+            i += 2
+            continue
+        if byte == 0x28:  # (
+            depth += 1
+        elif byte == 0x29:  # )
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return length
+
+
+def _decode_literal(body: bytes) -> str:
+    """Decode a PDF literal string, resolving escape sequences."""
+    out = bytearray()
+    i = 0
+    length = len(body)
+    while i < length:
+        byte = body[i]
+        if byte != 0x5C or i + 1 >= length:  # backslash
+            out.append(byte)
+            i += 1
+            continue
+        nxt = body[i + 1]
+        if nxt in _PDF_ESCAPES:
+            out += _PDF_ESCAPES[nxt]
+            i += 2
+        elif 0x30 <= nxt <= 0x37:  # octal escape \ddd
+            j = i + 1
+            while j < length and j < i + 4 and 0x30 <= body[j] <= 0x37:
+                j += 1
+            out.append(int(body[i + 1:j], 8) & 0xFF)
+            i = j
+        elif nxt in (0x0A, 0x0D):  # line continuation
+            i += 2
+        else:
+            out.append(nxt)
+            i += 2
+    return _decode_bytes(bytes(out))
+
+
+def _decode_hex(body: bytes) -> str:
+    """Decode a PDF hex string."""
+    digits = re.sub(rb"\s", b"", body)
+    if len(digits) % 2:
+        digits += b"0"
+    try:
+        return _decode_bytes(bytes.fromhex(digits.decode("ascii")))
+    except ValueError:
+        return ""
+
+
+def _decode_bytes(raw: bytes) -> str:
+    """Decode string bytes as UTF-16 when marked with a BOM, else Latin-1."""
+    if raw.startswith(b"\xfe\xff"):
+        return raw[2:].decode("utf-16-be", errors="ignore")
+    return raw.decode("latin-1")
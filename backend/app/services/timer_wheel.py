@@ -0,0 +1,162 @@
+"""Hierarchical timer wheel."""
+import math
+import threading
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel for many long-lived deadlines.
+
+    Deadlines are bucketed into ``levels`` wheels of ``slots`` slots each;
+    level 0 slots are one tick wide and every higher level is ``slots``
+    times coarser. Scheduling and cancelling are O(1). Advancing one tick
+    visits only the level 0 slot that expires and, once per wheel turn,
+    cascades one slot of the next level down, so the cost of a tick is
+    bounded by the number of deadlines it touches rather than the number
+    of scheduled ones. Deadlines beyond the top level's range are parked
+    in its farthest slot and re-placed when that slot cascades.
+    """
+
+    def __init__(self, tick_seconds: float, now: float, slots: int = 64, levels: int = 4):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self._tick_seconds = tick_seconds
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._levels = levels
+        self._wheels: List[List[Dict[Hashable, Tuple[float, Any]]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._max_delta = (1 << (self._bits * levels)) - 1
+        self._current = self._elapsed_ticks(now)
+        # key -> (level, slot) of its current entry; -1 marks the due list
+        self._where: Dict[Hashable, Tuple[int, int]] = {}
+        # Deadlines that were already due when scheduled
+        self._due: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, deadline: float, payload: Any = None):
+        """
+        Schedule a deadline, replacing any earlier one with the same key.
+
+        Args:
+            key: Timer key
+            deadline: Expiry time in seconds (same clock as ``advance``)
+            payload: Value returned with the key when the deadline expires
+        """
+        with self._lock:
+            self._remove(key)
+            self._place(key, deadline, payload)
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Cancel a scheduled deadline.
+
+        Args:
+            key: Timer key
+
+        Returns:
+            True if a deadline was cancelled
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def advance(self, now: float) -> List[Tuple[Hashable, float, Any]]:
+        """
+        Move the wheel forward to ``now`` and collect expired deadlines.
+
+        Args:
+            now: Current time in seconds
+
+        Returns:
+            List of (key, deadline, payload) in expiry order
+        """
+        target = self._elapsed_ticks(now)
+        expired = []
+
+        with self._lock:
+            self._drain_due(expired)
+
+            while self._current < target:
+                if not self._where:
+                    # Nothing scheduled, skip the idle ticks
+                    self._current = target
+                    break
+                self._current += 1
+                self._cascade(self._current)
+
+                slot = self._wheels[0][self._current & self._mask]
+                if slot:
+                    for key, (deadline, payload) in slot.items():
+                        del self._where[key]
+                        expired.append((key, deadline, payload))
+                    slot.clear()
+                # Cascaded entries can land on the current tick
+                self._drain_due(expired)
+
+        return expired
+
+    def _tick_of(self, ts: float) -> int:
+        """Convert a deadline to the tick it expires on (rounded up)."""
+        return math.ceil(ts / self._tick_seconds)
+
+    def _elapsed_ticks(self, now: float) -> int:
+        """Convert a time to the last tick fully reached (rounded down)."""
+        return math.floor(now / self._tick_seconds)
+
+    def _place(self, key: Hashable, deadline: float, payload: Any):
+        """Insert an entry into the level and slot covering its deadline."""
+        expires = self._tick_of(deadline)
+        delta = expires - self._current
+        if delta <= 0:
+            self._due[key] = (deadline, payload)
+            self._where[key] = (-1, 0)
+            return
+
+        expires = self._current + min(delta, self._max_delta)
+        for level in range(self._levels):
+            if delta < 1 << (self._bits * (level + 1)) or level == self._levels - 1:
+                slot = (expires >> (self._bits * level)) & self._mask
+                self._wheels[level][slot][key] = (deadline, payload)
+                self._where[key] = (level, slot)
+                return
+
+    def _remove(self, key: Hashable) -> bool:
+        """Remove an entry wherever it is stored."""
+        location = self._where.pop(key, None)
+        if location is None:
+            return False
+        level, slot = location
+        if level < 0:
+            del self._due[key]
+        else:
+            del self._wheels[level][slot][key]
+        return True
+
+    def _drain_due(self, expired: list):
+        """Move entries that are already due to the expired list."""
+        if self._due:
+            for key, (deadline, payload) in self._due.items():
+                del self._where[key]
+                expired.append((key, deadline, payload))
+            self._due.clear()
+
+    def _cascade(self, tick: int):
+        """Re-place the entries of higher-level slots that start at this tick."""
+        for level in range(1, self._levels):
+            if tick & ((1 << (self._bits * level)) - 1):
+                return
+            slot = self._wheels[level][(tick >> (self._bits * level)) & self._mask]
+            if not slot:
+                continue
+            entries = list(slot.items())
+            slot.clear()
+            for key, (deadline, payload) in entries:
+                self._place(key, deadline, payload)
@@ -0,0 +1,456 @@
+"""Lightweight request tracing with OTLP-compatible JSON export."""
+import asyncio
+import functools
+import inspect
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import (
+    TRACING_BUFFER_SIZE,
+    TRACING_EXPORT_FILE,
+    TRACING_FLUSH_INTERVAL_SECONDS,
+    TRACING_MAX_SPANS_PER_TRACE,
+    TRACING_SAMPLE_RATE,
+    TRACING_SERVICE_NAME,
+)
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# W3C trace context header: version-trace_id-parent_id-flags
+TRACEPARENT_HEADER = "traceparent"
+_TRACEPARENT_RE = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+# Span of the code currently running, None when the request is not sampled
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class _Trace:
+    """Spans of one trace recorded in this process."""
+
+    __slots__ = ("trace_id", "spans", "open", "dropped")
+
+    def __init__(self, trace_id: str):
+        self.trace_id = trace_id
+        self.spans: List["Span"] = []
+        self.open = 0
+        self.dropped = 0
+
+
+class Span:
+    """
+    A timed operation within a trace.
+
+    Use as a context manager; entering makes it the parent of spans started
+    in the same context, exiting records errors and ends it.
+    """
+
+    __slots__ = (
+        "tracer", "trace", "span_id", "parent_id", "name", "kind",
+        "start_ns", "end_ns", "attributes", "status", "status_message", "_token",
+    )
+
+    def __init__(self, tracer: "Tracer", trace: _Trace, name: str, parent_id: Optional[str], kind: int):
+        self.tracer = tracer
+        self.trace = trace
+        self.span_id = _random_id(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = STATUS_UNSET
+        self.status_message: Optional[str] = None
+        self._token = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    def set_attribute(self, key: str, value: Any):
+        """Set a span attribute (str, bool, int or float)."""
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException):
+        """Mark the span as failed by an exception."""
+        self.status = STATUS_ERROR
+        self.status_message = f"{type(exc).__name__}: {exc}"
+
+    def end(self):
+        """End the span; ending twice has no effect."""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer._on_end(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.record_error(exc)
+        _current_span.reset(self._token)
+        self.end()
+        return False
+
+
+class _NoopSpan:
+    """Span returned when nothing is sampled; every operation is a no-op."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def record_error(self, exc: BaseException):
+        pass
+
+    def end(self):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """
+    Records sampled traces in a ring buffer and optionally a JSON lines file.
+
+    The sampling decision is made once per request: a sampled incoming
+    ``traceparent`` is always followed, an unsampled one never, and other
+    requests are sampled at ``sample_rate``. When a request is not sampled
+    no span objects are created, so instrumented code only pays for one
+    context variable lookup.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = TRACING_SAMPLE_RATE,
+        buffer_size: int = TRACING_BUFFER_SIZE,
+        max_spans_per_trace: int = TRACING_MAX_SPANS_PER_TRACE,
+        export_file: Optional[Path] = TRACING_EXPORT_FILE,
+        flush_interval: float = TRACING_FLUSH_INTERVAL_SECONDS,
+        service_name: str = TRACING_SERVICE_NAME
+    ):
+        self.sample_rate = sample_rate
+        self._max_spans = max_spans_per_trace
+        self._export_file = Path(export_file) if export_file else None
+        self._flush_interval = flush_interval
+        self._resource = {"attributes": [_attribute("service.name", service_name)]}
+        self._traces: deque = deque(maxlen=buffer_size)
+        self._pending: deque = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+        # Counters
+        self.sampled = 0
+        self.spans_dropped = 0
+        self.exported = 0
+        self.export_dropped = 0
+
+    async def start(self):
+        """Start the file exporter (only when an export file is configured)."""
+        if self._export_file is not None and self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Stop the file exporter and write pending traces."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._export_file is not None:
+            await asyncio.to_thread(self._write_pending)
+
+    def start_trace(self, name: str, traceparent: Optional[str] = None) -> Optional[Span]:
+        """
+        Start the local root span of a request if it is sampled.
+
+        Args:
+            name: Span name
+            traceparent: Incoming W3C traceparent header
+
+        Returns:
+            Server span (not yet entered) or None if the request is not sampled
+        """
+        parent = parse_traceparent(traceparent) if traceparent else None
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = None, None
+            sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not sampled:
+            return None
+
+        self.sampled += 1
+        trace = _Trace(trace_id or _random_id(16))
+        return self._new_span(trace, name, parent_id, SPAN_KIND_SERVER)
+
+    def start_span(self, name: str) -> Any:
+        """
+        Start a child of the current span.
+
+        Args:
+            name: Span name
+
+        Returns:
+            Span (not yet entered), or NOOP_SPAN outside a sampled trace
+        """
+        parent = _current_span.get()
+        if parent is None:
+            return NOOP_SPAN
+        trace = parent.trace
+        if len(trace.spans) + trace.open >= self._max_spans:
+            trace.dropped += 1
+            self.spans_dropped += 1
+            return NOOP_SPAN
+        return self._new_span(trace, name, parent.span_id, SPAN_KIND_INTERNAL)
+
+    def get_traces(self, limit: int = 20, min_duration_ms: float = 0) -> dict:
+        """
+        Get recent completed traces as an OTLP JSON document, newest first.
+
+        Args:
+            limit: Maximum number of traces
+            min_duration_ms: Only traces whose root span took at least this long
+
+        Returns:
+            OTLP ExportTraceServiceRequest-shaped dictionary
+        """
+        selected = []
+        for trace in reversed(self._traces):
+            if _duration_ms(trace) >= min_duration_ms:
+                selected.append(trace)
+                if len(selected) >= limit:
+                    break
+        return self._to_otlp(selected)
+
+    def get_trace(self, trace_id: str) -> Optional[dict]:
+        """
+        Get one completed trace as an OTLP JSON document.
+
+        Args:
+            trace_id: 32-character hex trace ID
+
+        Returns:
+            OTLP dictionary or None if the trace is not buffered
+        """
+        for trace in reversed(self._traces):
+            if trace.trace_id == trace_id:
+                return self._to_otlp([trace])
+        return None
+
+    def get_stats(self) -> dict:
+        """
+        Get tracing statistics.
+
+        Returns:
+            Dictionary with sampling, buffer and export counters
+        """
+        return {
+            "sample_rate": self.sample_rate,
+            "sampled": self.sampled,
+            "buffered": len(self._traces),
+            "spans_dropped": self.spans_dropped,
+            "export_file": str(self._export_file) if self._export_file else None,
+            "export_pending": len(self._pending),
+            "exported": self.exported,
+            "export_dropped": self.export_dropped,
+        }
+
+    def _new_span(self, trace: _Trace, name: str, parent_id: Optional[str], kind: int) -> Span:
+        """Create a span and count it as open in its trace."""
+        with self._lock:
+            trace.open += 1
+        return Span(self, trace, name, parent_id, kind)
+
+    def _on_end(self, span: Span):
+        """Collect an ended span; buffer the trace when its last span ends."""
+        trace = span.trace
+        with self._lock:
+            trace.spans.append(span)
+            trace.open -= 1
+            if trace.open:
+                return
+            self._traces.append(trace)
+            if self._export_file is not None:
+                if len(self._pending) == self._pending.maxlen:
+                    self.export_dropped += 1
+                self._pending.append(trace)
+
+    async def _flush_loop(self):
+        """Append pending traces to the export file periodically."""
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await asyncio.to_thread(self._write_pending)
+            except OSError:
+                # Keep the traces pending and retry on the next interval
+                pass
+
+    def _write_pending(self):
+        """Write pending traces as OTLP JSON lines, one trace per line."""
+        if not self._pending:
+            return
+        with self._lock:
+            traces = list(self._pending)
+            self._pending.clear()
+        lines = [json.dumps(self._to_otlp([trace]), separators=(",", ":")) + "\n" for trace in traces]
+        try:
+            with open(self._export_file, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+        except OSError:
+            with self._lock:
+                self._pending.extendleft(reversed(traces))
+            raise
+        self.exported += len(traces)
+
+    def _to_otlp(self, traces: List[_Trace]) -> dict:
+        """Convert traces to the OTLP/JSON trace export format."""
+        spans = [_span_to_otlp(span) for trace in traces for span in trace.spans]
+        return {
+            "resourceSpans": [{
+                "resource": self._resource,
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }]
+        }
+
+
+def span(name: str) -> Any:
+    """
+    Start a child span of the current span, for use in a ``with`` block.
+
+    Args:
+        name: Span name
+
+    Returns:
+        Span or NOOP_SPAN outside a sampled trace
+    """
+    if _current_span.get() is None:
+        return NOOP_SPAN
+    return get_tracer().start_span(name)
+
+
+def traced(func):
+    """Decorator recording each call of a function or coroutine as a span."""
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return await func(*args, **kwargs)
+            with get_tracer().start_span(name):
+                return await func(*args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current_span.get() is None:
+            return func(*args, **kwargs)
+        with get_tracer().start_span(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def current_span() -> Optional[Span]:
+    """Get the current span, or None outside a sampled trace."""
+    return _current_span.get()
+
+
+def parse_traceparent(header: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse a W3C traceparent header.
+
+    Args:
+        header: Header value
+
+    Returns:
+        Tuple of (trace_id, parent_span_id, sampled) or None if invalid
+    """
+    match = _TRACEPARENT_RE.match(header.strip().lower())
+    if not match:
+        return None
+    version, trace_id, parent_id, flags = match.groups()
+    if version == "ff" or trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+def format_traceparent(span: Span) -> str:
+    """Format the traceparent header that continues a span's trace."""
+    return f"00-{span.trace_id}-{span.span_id}-01"
+
+
+def _random_id(size: int) -> str:
+    """Random non-zero hex ID of ``size`` bytes."""
+    return f"{random.getrandbits(8 * size) or 1:0{2 * size}x}"
+
+
+def _duration_ms(trace: _Trace) -> float:
+    """Duration of a trace from its first start to its last end."""
+    start = min(span.start_ns for span in trace.spans)
+    end = max(span.end_ns for span in trace.spans)
+    return (end - start) / 1e6
+
+
+def _attribute(key: str, value: Any) -> dict:
+    """Convert an attribute to an OTLP key/value pair."""
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _span_to_otlp(span: Span) -> dict:
+    """Convert a span to OTLP/JSON."""
+    data = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": span.status},
+    }
+    if span.parent_id:
+        data["parentSpanId"] = span.parent_id
+    if span.status_message:
+        data["status"]["message"] = span.status_message
+    return data
+
+
+# Global tracer instance (singleton pattern)
+_tracer = None
+
+
+def get_tracer() -> Tracer:
+    """Get the global tracer instance."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
@@ -0,0 +1,278 @@
+"""Incremental reclaimer for orphaned upload files."""
+import asyncio
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from app.config import (
+    UPLOAD_DIR,
+    UPLOAD_GC_BATCH_PAUSE_SECONDS,
+    UPLOAD_GC_BATCH_SIZE,
+    UPLOAD_GC_DRY_RUN,
+    UPLOAD_GC_GRACE_SECONDS,
+    UPLOAD_GC_MAX_BYTES_PER_SECOND,
+    UPLOAD_GC_MAX_CANDIDATES,
+    UPLOAD_GC_PASS_INTERVAL_SECONDS,
+)
+from app.models.upload_gc import UploadGcPass, UploadGcStatus
+from app.services.document_service import get_document_service
+from app.services.maintenance_service import get_maintenance_service
+
+
+class UploadReclaimer:
+    """
+    Removes upload files that this process knows to be orphaned.
+
+    Reference indexes live in process memory, so an unreferenced file is
+    not necessarily an orphan: it may belong to a report created before a
+    restart or by another worker. Only known orphans are ever deleted:
+    photos detached from their last report (collected from the maintenance
+    service) and files left behind by failed uploads (registered with
+    release). Other unreferenced files are only reported as unclaimed.
+
+    A pass walks the upload directory in small batches. Directory listing
+    and deletion run in the thread pool; reference checks run on the event
+    loop against the reference indexes of the maintenance and document
+    services. Between batches the pass sleeps for a fixed pause, extended
+    so that deletions stay under a bytes-per-second budget. Files younger
+    than the grace period are never touched, which covers uploads whose
+    report or document is not registered yet.
+    """
+
+    def __init__(
+        self,
+        upload_dir: Path = UPLOAD_DIR,
+        grace_seconds: int = UPLOAD_GC_GRACE_SECONDS,
+        batch_size: int = UPLOAD_GC_BATCH_SIZE,
+        batch_pause: float = UPLOAD_GC_BATCH_PAUSE_SECONDS,
+        max_bytes_per_second: int = UPLOAD_GC_MAX_BYTES_PER_SECOND,
+        pass_interval: float = UPLOAD_GC_PASS_INTERVAL_SECONDS,
+        dry_run: bool = UPLOAD_GC_DRY_RUN
+    ):
+        self._dir = upload_dir
+        self._grace_seconds = grace_seconds
+        self._batch_size = batch_size
+        self._batch_pause = batch_pause
+        self._max_bytes_per_second = max_bytes_per_second
+        self._pass_interval = pass_interval
+        self._dry_run = dry_run
+        self._known_orphans: Set[str] = set()
+        self._current: Optional[UploadGcPass] = None
+        self._task: Optional[asyncio.Task] = None
+        self._manual_task: Optional[asyncio.Task] = None
+        self.last_pass: Optional[UploadGcPass] = None
+
+        # Counters
+        self.passes = 0
+        self.reclaimed_files_total = 0
+        self.reclaimed_bytes_total = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether a pass is in progress."""
+        return self._current is not None
+
+    async def start(self):
+        """Start periodic background passes."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._pass_loop())
+
+    async def stop(self):
+        """Stop background and manually triggered passes."""
+        for task in (self._task, self._manual_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._task = None
+        self._manual_task = None
+
+    def release(self, filename: str):
+        """
+        Mark an upload file as orphaned, for example after a failed upload.
+
+        Args:
+            filename: Filename in the upload directory
+        """
+        self._known_orphans.add(filename)
+
+    def trigger(self, dry_run: Optional[bool] = None) -> bool:
+        """
+        Start a pass in the background.
+
+        Args:
+            dry_run: Only report orphans (defaults to the configured mode)
+
+        Returns:
+            False if a pass is already running
+        """
+        if self.running:
+            return False
+        self._manual_task = asyncio.create_task(self.run_pass(dry_run))
+        return True
+
+    async def run_pass(self, dry_run: Optional[bool] = None) -> UploadGcPass:
+        """
+        Walk the upload directory once and reclaim known orphaned files.
+
+        Args:
+            dry_run: Only report orphans (defaults to the configured mode)
+
+        Returns:
+            Pass result
+
+        Raises:
+            RuntimeError: If a pass is already running
+        """
+        if self.running:
+            raise RuntimeError("An upload reclaimer pass is already running")
+
+        result = UploadGcPass(
+            dry_run=self._dry_run if dry_run is None else dry_run,
+            started_at=datetime.now(),
+        )
+        self._current = result
+        self._known_orphans.update(get_maintenance_service().pop_released_photos())
+        pending = set(self._known_orphans)
+        seen: Set[str] = set()
+        try:
+            entries = await asyncio.to_thread(os.scandir, self._dir)
+            try:
+                while True:
+                    batch = await asyncio.to_thread(self._read_batch, entries, result)
+                    if not batch:
+                        break
+                    orphans = self._select_orphans(batch, result, seen)
+                    freed = 0
+                    if orphans and not result.dry_run:
+                        freed = await asyncio.to_thread(self._delete, orphans, result)
+                    await asyncio.sleep(max(self._batch_pause, freed / self._max_bytes_per_second))
+            finally:
+                entries.close()
+
+            # Known orphans whose file is already gone
+            self._known_orphans -= pending - seen
+            result.finished_at = datetime.now()
+            self.last_pass = result
+            self.passes += 1
+            self.reclaimed_files_total += result.reclaimed_files
+            if not result.dry_run:
+                self.reclaimed_bytes_total += result.reclaimed_bytes
+            return result
+        finally:
+            self._current = None
+
+    def get_status(self) -> UploadGcStatus:
+        """
+        Get the reclaimer status.
+
+        Returns:
+            Status with totals, the running pass and the last completed pass
+        """
+        return UploadGcStatus(
+            running=self.running,
+            grace_seconds=self._grace_seconds,
+            passes=self.passes,
+            reclaimed_files_total=self.reclaimed_files_total,
+            reclaimed_bytes_total=self.reclaimed_bytes_total,
+            current_pass=self._current,
+            last_pass=self.last_pass,
+        )
+
+    async def _pass_loop(self):
+        """Run a pass every pass interval."""
+        while True:
+            await asyncio.sleep(self._pass_interval)
+            if self.running:
+                continue
+            try:
+                await self.run_pass()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Retry on the next interval
+                pass
+
+    def _read_batch(self, entries, result: UploadGcPass) -> List[Tuple[str, int, float]]:
+        """Read the next batch of (name, size, mtime) of regular files."""
+        batch = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                result.errors += 1
+                continue
+            batch.append((entry.name, stat.st_size, stat.st_mtime))
+            if len(batch) >= self._batch_size:
+                break
+        return batch
+
+    def _select_orphans(
+        self,
+        batch: List[Tuple[str, int, float]],
+        result: UploadGcPass,
+        seen: Set[str]
+    ) -> List[Tuple[str, int]]:
+        """Classify a batch and return the known orphans to delete."""
+        maintenance_service = get_maintenance_service()
+        document_service = get_document_service()
+        cutoff = datetime.now().timestamp() - self._grace_seconds
+
+        orphans = []
+        for name, size, mtime in batch:
+            result.scanned += 1
+            if maintenance_service.references_file(name) or document_service.get_document(name):
+                # Referenced again since it was released
+                self._known_orphans.discard(name)
+                result.referenced += 1
+            elif mtime > cutoff:
+                # Too young to reclaim; a known orphan stays pending
+                seen.add(name)
+                result.within_grace += 1
+            elif name not in self._known_orphans:
+                result.unclaimed += 1
+                result.unclaimed_bytes += size
+            else:
+                seen.add(name)
+                result.orphaned += 1
+                if len(result.candidates) < UPLOAD_GC_MAX_CANDIDATES:
+                    result.candidates.append(name)
+                if result.dry_run:
+                    result.reclaimed_bytes += size
+                else:
+                    orphans.append((name, size))
+        return orphans
+
+    def _delete(self, orphans: List[Tuple[str, int]], result: UploadGcPass) -> int:
+        """Delete orphaned files and return the number of bytes freed."""
+        freed = 0
+        for name, size in orphans:
+            try:
+                (self._dir / name).unlink()
+            except FileNotFoundError:
+                self._known_orphans.discard(name)
+                continue
+            except OSError:
+                result.errors += 1
+                continue
+            self._known_orphans.discard(name)
+            result.reclaimed_files += 1
+            result.reclaimed_bytes += size
+            freed += size
+        return freed
+
+
+# Global service instance (singleton pattern)
+_upload_reclaimer = None
+
+
+def get_upload_reclaimer() -> UploadReclaimer:
+    """Get the global upload reclaimer instance."""
+    global _upload_reclaimer
+    if _upload_reclaimer is None:
+        _upload_reclaimer = UploadReclaimer()
+    return _upload_reclaimer
@@ -0,0 +1,360 @@
+"""Warehouse service for material stock and reservations."""
+import itertools
+import threading
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from app.config import WAREHOUSE_LEDGER_CAPACITY, WAREHOUSE_LOCK_STRIPES
+from app.models.warehouse import (
+    Material,
+    MaterialCreate,
+    MaterialItem,
+    MovementType,
+    Reservation,
+    ReservationCreate,
+    ReservationStatus,
+    StockMovement,
+)
+
+# Initial stock, matching the warehouse seed data of the frontend
+DEFAULT_MATERIALS = [
+    MaterialCreate(id="1", name="Steel Sheets", quantity=500, unit="kg", min_stock=200, category="Raw Material"),
+    MaterialCreate(id="2", name="Aluminum Rods", quantity=150, unit="kg", min_stock=100, category="Raw Material"),
+    MaterialCreate(id="3", name="Circuit Boards", quantity=250, unit="units", min_stock=50, category="Components"),
+    MaterialCreate(id="4", name="Screws & Bolts", quantity=5000, unit="units", min_stock=1000, category="Hardware"),
+    MaterialCreate(id="5", name="Plastic Casings", quantity=180, unit="units", min_stock=80, category="Components"),
+    MaterialCreate(id="6", name="Rubber Seals", quantity=450, unit="units", min_stock=100, category="Components"),
+]
+
+
+class UnknownMaterialError(Exception):
+    """Raised when a material ID does not exist."""
+
+    def __init__(self, material_ids: List[str]):
+        self.material_ids = material_ids
+        super().__init__(f"Unknown materials: {', '.join(material_ids)}")
+
+
+class InsufficientStockError(Exception):
+    """Raised when a reservation exceeds the available stock."""
+
+    def __init__(self, material_id: str, requested: float, available: float):
+        self.material_id = material_id
+        self.requested = requested
+        self.available = available
+        super().__init__(
+            f"Insufficient stock for material {material_id}: "
+            f"requested {requested}, available {available}"
+        )
+
+
+class WarehouseService:
+    """
+    Service for material stock, reservations and the movement ledger.
+
+    Quantities are guarded by a fixed set of striped locks. A reservation
+    takes the stripes of all its materials in index order, checks every
+    line and only then applies the deductions, so a bill is reserved
+    all-or-nothing and stock can never be allocated twice.
+    """
+
+    def __init__(
+        self,
+        stripes: int = WAREHOUSE_LOCK_STRIPES,
+        ledger_capacity: int = WAREHOUSE_LEDGER_CAPACITY,
+        seed: bool = True
+    ):
+        # In-memory storage (can be replaced with database)
+        self._materials: Dict[str, MaterialCreate] = {}
+        self._quantities: Dict[str, float] = {}
+        self._low_stock: set[str] = set()
+        self._reservations: Dict[str, Reservation] = {}
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._reservations_lock = threading.Lock()
+
+        # Movement ledger of
+        # (seq, material_id, type, delta, balance, reference, timestamp),
+        # a ring keeping the latest ledger_capacity movements: seq s is
+        # stored in slot s % ledger_capacity
+        self._ledger: List[Optional[tuple]] = [None] * ledger_capacity
+        self._ledger_lock = threading.Lock()
+        self._ledger_seq = itertools.count(1)
+        self._ledger_last = 0
+
+        if seed:
+            for material in DEFAULT_MATERIALS:
+                self.create_material(material)
+
+    def create_material(self, material_data: MaterialCreate) -> Optional[Material]:
+        """
+        Create a new material.
+
+        Args:
+            material_data: Material data including the initial quantity
+
+        Returns:
+            Created material or None if the ID already exists
+        """
+        with self._stripe(material_data.id):
+            if material_data.id in self._materials:
+                return None
+            self._materials[material_data.id] = material_data.model_copy(update={"quantity": 0})
+            self._quantities[material_data.id] = 0
+            self._update_low_stock(material_data.id)
+            if material_data.quantity:
+                self._apply(material_data.id, material_data.quantity, MovementType.RECEIVE, "initial stock")
+
+        return self.get_material(material_data.id)
+
+    def get_material(self, material_id: str) -> Optional[Material]:
+        """
+        Get a material by ID.
+
+        Args:
+            material_id: Material ID
+
+        Returns:
+            Material or None if not found
+        """
+        material = self._materials.get(material_id)
+        if not material:
+            return None
+
+        return Material(
+            id=material.id,
+            name=material.name,
+            quantity=self._quantities[material_id],
+            unit=material.unit,
+            min_stock=material.min_stock,
+            category=material.category,
+            low_stock=material_id in self._low_stock,
+        )
+
+    def get_all_materials(self) -> List[Material]:
+        """
+        Get all materials.
+
+        Returns:
+            List of materials
+        """
+        return [self.get_material(material_id) for material_id in list(self._materials)]
+
+    def get_low_stock_materials(self) -> List[Material]:
+        """
+        Get materials at or below their minimum stock.
+
+        The low-stock set is maintained on every movement, so this does
+        not scan the whole stock table.
+
+        Returns:
+            List of low-stock materials
+        """
+        return [self.get_material(material_id) for material_id in list(self._low_stock)]
+
+    def receive_stock(
+        self,
+        material_id: str,
+        quantity: float,
+        reference: Optional[str] = None
+    ) -> Optional[Material]:
+        """
+        Add received stock to a material.
+
+        Args:
+            material_id: Material ID
+            quantity: Quantity received
+            reference: Delivery note or other reference
+
+        Returns:
+            Updated material or None if not found
+        """
+        if material_id not in self._materials:
+            return None
+
+        with self._stripe(material_id):
+            self._apply(material_id, quantity, MovementType.RECEIVE, reference)
+
+        return self.get_material(material_id)
+
+    def reserve(self, reservation_data: ReservationCreate) -> Reservation:
+        """
+        Reserve a bill of materials all-or-nothing.
+
+        Args:
+            reservation_data: Materials to reserve and requester
+
+        Returns:
+            Created reservation
+
+        Raises:
+            UnknownMaterialError: If a material does not exist
+            InsufficientStockError: If any line exceeds the available stock
+        """
+        totals = _merge_items(reservation_data.items)
+        unknown = [material_id for material_id in totals if material_id not in self._materials]
+        if unknown:
+            raise UnknownMaterialError(unknown)
+
+        reservation_id = f"rs_{uuid4().hex[:8]}"
+
+        with self._stripes_for(totals):
+            for material_id, quantity in totals.items():
+                available = self._quantities[material_id]
+                if available < quantity:
+                    raise InsufficientStockError(material_id, quantity, available)
+
+            for material_id, quantity in totals.items():
+                self._apply(material_id, -quantity, MovementType.RESERVE, reservation_id)
+
+        reservation = Reservation(
+            id=reservation_id,
+            items=[MaterialItem(material_id=m, quantity=q) for m, q in totals.items()],
+            line_id=reservation_data.line_id,
+            requested_by=reservation_data.requested_by,
+            status=ReservationStatus.ACTIVE,
+            created_at=datetime.now(),
+        )
+        with self._reservations_lock:
+            self._reservations[reservation_id] = reservation
+
+        return reservation
+
+    def release(self, reservation_id: str) -> Optional[Reservation]:
+        """
+        Release a reservation and return its materials to stock.
+
+        Releasing an already released reservation has no effect.
+
+        Args:
+            reservation_id: Reservation ID
+
+        Returns:
+            Released reservation or None if not found
+        """
+        with self._reservations_lock:
+            reservation = self._reservations.get(reservation_id)
+            if not reservation or reservation.status == ReservationStatus.RELEASED:
+                return reservation
+            reservation.status = ReservationStatus.RELEASED
+            reservation.released_at = datetime.now()
+
+        totals = {item.material_id: item.quantity for item in reservation.items}
+        with self._stripes_for(totals):
+            for material_id, quantity in totals.items():
+                self._apply(material_id, quantity, MovementType.RELEASE, reservation_id)
+
+        return reservation
+
+    def get_reservation(self, reservation_id: str) -> Optional[Reservation]:
+        """
+        Get a reservation by ID.
+
+        Args:
+            reservation_id: Reservation ID
+
+        Returns:
+            Reservation or None if not found
+        """
+        return self._reservations.get(reservation_id)
+
+    def get_movements(
+        self,
+        material_id: Optional[str] = None,
+        limit: int = 100
+    ) -> List[StockMovement]:
+        """
+        Get the most recent ledger movements, newest first.
+
+        Only the retained movements (WAREHOUSE_LEDGER_CAPACITY) are
+        searched, walking back from the newest one until limit is reached.
+
+        Args:
+            material_id: Filter by material ID
+            limit: Maximum number of movements
+
+        Returns:
+            List of stock movements
+        """
+        movements = []
+        capacity = len(self._ledger)
+        last = self._ledger_last
+        for seq in range(last, max(0, last - capacity), -1):
+            entry = self._ledger[seq % capacity]
+            if entry is None or entry[0] != seq:
+                # Overwritten by newer movements while walking back
+                break
+            if material_id and entry[1] != material_id:
+                continue
+            movements.append(StockMovement(
+                seq=entry[0],
+                material_id=entry[1],
+                type=entry[2],
+                delta=entry[3],
+                balance=entry[4],
+                reference=entry[5],
+                timestamp=entry[6],
+            ))
+            if len(movements) >= limit:
+                break
+        return movements
+
+    def _stripe(self, material_id: str) -> threading.Lock:
+        """Get the lock stripe guarding a material."""
+        return self._stripes[hash(material_id) % len(self._stripes)]
+
+    def _stripes_for(self, material_ids) -> ExitStack:
+        """Acquire the stripes of several materials in a deadlock-free order."""
+        indexes = sorted({hash(m) % len(self._stripes) for m in material_ids})
+        stack = ExitStack()
+        for index in indexes:
+            stack.enter_context(self._stripes[index])
+        return stack
+
+    def _apply(
+        self,
+        material_id: str,
+        delta: float,
+        movement_type: MovementType,
+        reference: Optional[str]
+    ):
+        """Change a quantity and append the movement (caller holds the stripe)."""
+        balance = self._quantities[material_id] + delta
+        self._quantities[material_id] = balance
+        self._update_low_stock(material_id)
+
+        with self._ledger_lock:
+            seq = next(self._ledger_seq)
+            self._ledger[seq % len(self._ledger)] = (
+                seq, material_id, movement_type,
+                delta, balance, reference, datetime.now()
+            )
+            self._ledger_last = seq
+
+    def _update_low_stock(self, material_id: str):
+        """Keep the low-stock set in sync with a material's quantity."""
+        if self._quantities[material_id] <= self._materials[material_id].min_stock:
+            self._low_stock.add(material_id)
+        else:
+            self._low_stock.discard(material_id)
+
+
+def _merge_items(items: List[MaterialItem]) -> Dict[str, float]:
+    """Sum the quantities of duplicate materials in a bill."""
+    totals: Dict[str, float] = {}
+    for item in items:
+        totals[item.material_id] = totals.get(item.material_id, 0) + item.quantity
+    return totals
+
+
+# Global service instance (singleton pattern)
+_warehouse_service = None
+
+
+def get_warehouse_service() -> WarehouseService:
+    """Get the global warehouse service instance."""
+    global _warehouse_service
+    if _warehouse_service is None:
+        _warehouse_service = WarehouseService()
+    return _warehouse_service
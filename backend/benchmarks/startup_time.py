@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Startup benchmark: time-to-first-request of the server entry points.
+
+Each variant is started as a subprocess on a free port. The benchmark polls
+GET /health until it answers 200 and reports the time from process start
+to that first response, followed by the latency of the first
+/openapi.json request (cold on an unwarmed worker) and the time the server
+takes to exit after SIGTERM.
+
+Variants:
+    serve          serve.py (app imported and warmed before forking)
+    serve-lazy     serve.py --no-preload (app imported in each worker)
+    uvicorn        plain `uvicorn app.main:app`
+
+Usage:
+    python benchmarks/startup_time.py [--runs 5] [--workers 2] [--variants serve uvicorn]
+"""
+import argparse
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent.resolve()
+
+STARTUP_TIMEOUT = 60.0
+POLL_INTERVAL = 0.005
+
+
+def variant_command(variant: str, port: int, workers: int):
+    if variant == "serve":
+        return [sys.executable, "serve.py", "--port", str(port), "--workers", str(workers),
+                "--host", "127.0.0.1", "--no-access-log"]
+    if variant == "serve-lazy":
+        return [sys.executable, "serve.py", "--port", str(port), "--workers", str(workers),
+                "--host", "127.0.0.1", "--no-access-log", "--no-preload"]
+    if variant == "uvicorn":
+        return [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+                "--host", "127.0.0.1", "--no-access-log"]
+    raise ValueError(f"Unknown variant: {variant}")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def get(url: str, timeout: float = 5.0) -> int:
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        response.read()
+        return response.status
+
+
+def measure(variant: str, workers: int) -> dict:
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        variant_command(variant, port, workers),
+        cwd=BACKEND_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = started + STARTUP_TIMEOUT
+        while True:
+            try:
+                if get(f"{base}/health", timeout=1.0) == 200:
+                    break
+            except (urllib.error.URLError, ConnectionError, OSError):
+                pass
+            if process.poll() is not None:
+                raise RuntimeError(f"{variant} exited with status {process.returncode}")
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"{variant} did not answer within {STARTUP_TIMEOUT}s")
+            time.sleep(POLL_INTERVAL)
+        first_request = time.perf_counter() - started
+
+        t = time.perf_counter()
+        get(f"{base}/openapi.json")
+        first_openapi = time.perf_counter() - t
+    finally:
+        t = time.perf_counter()
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        shutdown = time.perf_counter() - t
+
+    return {"first_request": first_request, "first_openapi": first_openapi, "shutdown": shutdown}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--variants", nargs="+", default=["serve", "serve-lazy", "uvicorn"],
+                        choices=["serve", "serve-lazy", "uvicorn"])
+    args = parser.parse_args()
+
+    print(f"{'variant':<12} {'first request':>16} {'first openapi':>16} {'shutdown':>12}")
+    for variant in args.variants:
+        results = [measure(variant, args.workers) for _ in range(args.runs)]
+
+        def median_ms(key):
+            return statistics.median(r[key] for r in results) * 1000
+
+        print(
+            f"{variant:<12} {median_ms('first_request'):>13.1f} ms"
+            f" {median_ms('first_openapi'):>13.1f} ms {median_ms('shutdown'):>9.1f} ms"
+        )
+    print(f"(median of {args.runs} runs, {args.workers} workers for serve variants)")
+
+
+if __name__ == "__main__":
+    main()
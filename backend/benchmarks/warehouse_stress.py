@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Concurrency stress benchmark for warehouse reservations.
+
+Many threads reserve (and partly release) random bills of materials
+against a small stock table. Afterwards the stock is checked against the
+movement ledger and the successful reservations: no material may go
+negative and nothing may be allocated twice.
+
+Usage:
+    python benchmarks/warehouse_stress.py [--threads 16] [--ops 20000]
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ensure the backend directory is in Python path
+BACKEND_DIR = Path(__file__).parent.parent.resolve()
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.warehouse import MaterialCreate, MaterialItem, ReservationCreate  # noqa: E402
+from app.services.warehouse_service import (  # noqa: E402
+    InsufficientStockError,
+    WarehouseService,
+)
+
+
+def run(threads: int, ops: int, materials: int, initial: int, release_ratio: float):
+    # Keep every movement: a bill has up to 4 items, reserved and released
+    service = WarehouseService(seed=False, ledger_capacity=materials + ops * 8)
+    for i in range(materials):
+        service.create_material(MaterialCreate(
+            id=f"m{i}", name=f"Material {i}", quantity=initial,
+            unit="units", min_stock=initial // 10, category="Bench"
+        ))
+
+    per_thread = ops // threads
+    active = [[] for _ in range(threads)]
+    counters = [[0, 0, 0] for _ in range(threads)]  # reserved, rejected, released
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        rng = random.Random(index)
+        barrier.wait()
+        for _ in range(per_thread):
+            bill = [
+                MaterialItem(material_id=f"m{rng.randrange(materials)}", quantity=rng.randint(1, 5))
+                for _ in range(rng.randint(1, 4))
+            ]
+            try:
+                reservation = service.reserve(ReservationCreate(items=bill, line_id=str(index)))
+                active[index].append(reservation.id)
+                counters[index][0] += 1
+            except InsufficientStockError:
+                counters[index][1] += 1
+            if active[index] and rng.random() < release_ratio:
+                service.release(active[index].pop(rng.randrange(len(active[index]))))
+                counters[index][2] += 1
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    reserved = sum(c[0] for c in counters)
+    rejected = sum(c[1] for c in counters)
+    released = sum(c[2] for c in counters)
+
+    # Verify: stock = initial - quantities of still active reservations
+    held = {f"m{i}": 0.0 for i in range(materials)}
+    for ids in active:
+        for reservation_id in ids:
+            for item in service.get_reservation(reservation_id).items:
+                held[item.material_id] += item.quantity
+
+    errors = []
+    for material in service.get_all_materials():
+        if material.quantity < 0:
+            errors.append(f"{material.id} went negative: {material.quantity}")
+        if material.quantity != initial - held[material.id]:
+            errors.append(
+                f"{material.id} stock {material.quantity} != {initial} - {held[material.id]} held"
+            )
+        if material.low_stock != (material.quantity <= material.min_stock):
+            errors.append(f"{material.id} low-stock flag out of sync")
+
+    ledger = service.get_movements(limit=10 ** 9)
+    for material_id in held:
+        movements = [m for m in ledger if m.material_id == material_id]
+        if sum(m.delta for m in movements) != service.get_material(material_id).quantity:
+            errors.append(f"{material_id} ledger does not sum to stock")
+
+    print(f"threads={threads} operations={reserved + rejected} elapsed={elapsed:.3f}s")
+    print(f"reserved={reserved} rejected={rejected} released={released} ledger={len(ledger)}")
+    print(f"throughput={(reserved + rejected + released) / elapsed:,.0f} ops/s")
+    if errors:
+        print("FAILED")
+        for error in errors[:20]:
+            print(f"  {error}")
+        return 1
+    print("OK: no double allocation, stock matches ledger")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--materials", type=int, default=8)
+    parser.add_argument("--initial", type=int, default=2000)
+    parser.add_argument("--release-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+    sys.exit(run(args.threads, args.ops, args.materials, args.initial, args.release_ratio))
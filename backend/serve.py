@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""Production server: pre-forked uvicorn workers on a shared socket.
+
+The master process binds the listening socket, imports and warms the
+application once, then forks the workers, which inherit the socket and the
+warmed modules. The master supervises the workers:
+
+    SIGTERM / SIGINT  graceful drain: workers stop accepting, finish open
+                      requests (up to --graceful-timeout), then exit
+    SIGHUP            rolling restart: workers are replaced one at a time;
+                      an old worker is stopped only after its replacement
+                      has completed startup
+    worker crash      the worker is replaced
+
+State (reports, dispatch queue, SLA timers, query cache, warehouse, audit
+segments, upload references) is kept in process memory, so the default is
+a single worker. Several workers (--workers N, or --workers-per-cpu for one
+per available CPU) each see only the requests they served and write the
+audit log concurrently; use them only once state is shared.
+
+Usage:
+    python serve.py [--host 0.0.0.0] [--port 8000] [--workers N | --workers-per-cpu] [--no-preload]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import select
+import signal
+import socket
+import sys
+import time
+from pathlib import Path
+
+import uvicorn
+
+# Ensure the backend directory is in Python path
+BACKEND_DIR = Path(__file__).parent.resolve()
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+APP_PATH = "app.main:app"
+
+# Requests sent through the application once before forking
+WARMUP_PATHS = ("/health", "/openapi.json", "/api/v1/maintenance/health")
+
+# Seconds to wait for a replacement worker to finish startup
+WORKER_READY_TIMEOUT = 60.0
+
+# Minimum seconds between two respawns of crashing workers
+RESPAWN_BACKOFF = 1.0
+
+logger = logging.getLogger("serve")
+
+
+def cpu_workers() -> int:
+    """One worker per CPU available to this process."""
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        return max(1, os.cpu_count() or 1)
+
+
+def fastest_loop() -> str:
+    """uvloop when installed, otherwise the standard asyncio loop."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
+
+
+def fastest_http() -> str:
+    """httptools when installed, otherwise h11."""
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        return "h11"
+    return "httptools"
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """Create the listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def load_app():
+    """Import the application object."""
+    module_name, attr = APP_PATH.split(":")
+    module = __import__(module_name, fromlist=[attr])
+    return getattr(module, attr)
+
+
+def warm_up(app):
+    """
+    Run a few requests through the application in-process.
+
+    This builds the middleware stack, the OpenAPI schema and the route and
+    validation caches once in the master, so forked workers start warm.
+    Lifespan is not run here; every worker runs its own startup.
+    """
+    async def request(path: str) -> int:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode("latin-1"),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"warmup")],
+            "client": ("127.0.0.1", 0),
+            "server": ("127.0.0.1", 0),
+        }
+        status = 0
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        await app(scope, receive, send)
+        return status
+
+    async def run():
+        for path in WARMUP_PATHS:
+            status = await request(path)
+            if status >= 400:
+                logger.warning("Warm-up request %s returned %d", path, status)
+
+    asyncio.run(run())
+
+
+class _WorkerServer(uvicorn.Server):
+    """uvicorn server that reports to the master once it accepts requests."""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        super().__init__(config)
+        self._ready_fd = ready_fd
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            os.write(self._ready_fd, b"1")
+        os.close(self._ready_fd)
+
+
+class Worker:
+    """A forked worker process as seen by the master."""
+
+    __slots__ = ("pid", "ready_fd", "started_at", "ready")
+
+    def __init__(self, pid: int, ready_fd: int):
+        self.pid = pid
+        self.ready_fd = ready_fd
+        self.started_at = time.monotonic()
+        self.ready = False
+
+
+class Master:
+    """Pre-fork master process supervising uvicorn workers."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.loop = fastest_loop()
+        self.http = fastest_http()
+        self.app = None
+        self.sock = None
+        self.workers: dict[int, Worker] = {}
+        self.retiring: set[int] = set()
+        self._stopping = False
+        self._restart_requested = False
+        self._last_respawn = 0.0
+        self._wakeup_r, self._wakeup_w = os.pipe()
+
+    def run(self):
+        """Bind, warm up, fork the workers and supervise them until stopped."""
+        started = time.monotonic()
+        self.sock = bind_socket(self.args.host, self.args.port, self.args.backlog)
+
+        if self.args.preload:
+            self.app = load_app()
+            warm_up(self.app)
+            logger.info("Application loaded and warmed in %.3fs", time.monotonic() - started)
+
+        self._install_signal_handlers()
+        if self.args.workers > 1:
+            logger.warning(
+                "Running %d workers: application state is per process, so each "
+                "worker sees only its own reports, caches and audit segments",
+                self.args.workers,
+            )
+        logger.info(
+            "Listening on %s:%d with %d workers (loop=%s, http=%s)",
+            self.args.host, self.args.port, self.args.workers, self.loop, self.http,
+        )
+        for _ in range(self.args.workers):
+            self.spawn()
+
+        while not self._stopping:
+            self._wait_for_signal(1.0)
+            self._poll_ready()
+            self._reap()
+            if self._restart_requested and not self._stopping:
+                self._restart_requested = False
+                self.rolling_restart()
+            if not self._stopping:
+                self._maintain_worker_count()
+
+        self.drain()
+
+    def spawn(self) -> Worker:
+        """Fork a new worker."""
+        ready_r, ready_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_r)
+            self._run_worker(ready_w)
+        os.close(ready_w)
+        worker = Worker(pid, ready_r)
+        self.workers[pid] = worker
+        return worker
+
+    def rolling_restart(self):
+        """Replace the workers one at a time without dropping capacity."""
+        logger.info("Rolling restart of %d workers", len(self.workers))
+        for old_pid in [pid for pid in self.workers if pid not in self.retiring]:
+            if self._stopping:
+                return
+            new = self.spawn()
+            if not self._wait_ready(new, WORKER_READY_TIMEOUT):
+                logger.error("Replacement worker %d did not start, aborting restart", new.pid)
+                self._signal(new.pid, signal.SIGKILL)
+                return
+            self._retire(old_pid)
+        logger.info("Rolling restart complete")
+
+    def drain(self):
+        """Stop all workers gracefully, killing those past the timeout."""
+        logger.info("Draining %d workers", len(self.workers))
+        for pid in list(self.workers):
+            self._retire(pid)
+
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self._wait_for_signal(0.1)
+            self._poll_ready()
+            self._reap()
+        for pid in list(self.workers):
+            logger.warning("Worker %d did not stop in time, killing it", pid)
+            self._signal(pid, signal.SIGKILL)
+        while self.workers:
+            self._reap(block=True)
+
+        self.sock.close()
+        logger.info("Shutdown complete")
+
+    def _run_worker(self, ready_fd: int):
+        """Worker process body; never returns."""
+        status = 0
+        try:
+            for sig in (signal.SIGHUP, signal.SIGCHLD, signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            signal.set_wakeup_fd(-1)
+            os.close(self._wakeup_r)
+            os.close(self._wakeup_w)
+            # Forked workers must not share the master's random state
+            random.seed()
+
+            config = uvicorn.Config(
+                self.app if self.app is not None else APP_PATH,
+                loop=self.loop,
+                http=self.http,
+                lifespan="on",
+                log_level=self.args.log_level,
+                access_log=self.args.access_log,
+                proxy_headers=True,
+                forwarded_allow_ips=self.args.forwarded_allow_ips,
+                timeout_keep_alive=self.args.keep_alive,
+                timeout_graceful_shutdown=self.args.graceful_timeout,
+                backlog=self.args.backlog,
+            )
+            server = _WorkerServer(config, ready_fd)
+            server.run(sockets=[self.sock])
+            if not server.started:
+                status = 3
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+            status = 1
+        finally:
+            os._exit(status)
+
+    def _install_signal_handlers(self):
+        """Record signals as flags; the wakeup pipe interrupts the main loop."""
+        os.set_blocking(self._wakeup_w, False)
+        signal.set_wakeup_fd(self._wakeup_w)
+
+        def stop(signum, frame):
+            self._stopping = True
+
+        def restart(signum, frame):
+            self._restart_requested = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGHUP, restart)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    def _wait_for_signal(self, timeout: float):
+        """Sleep until a signal arrives, a worker reports ready or the timeout passes."""
+        ready_fds = [w.ready_fd for w in self.workers.values() if w.ready_fd >= 0]
+        try:
+            readable, _, _ = select.select([self._wakeup_r] + ready_fds, [], [], timeout)
+        except InterruptedError:
+            return
+        if self._wakeup_r in readable:
+            try:
+                os.read(self._wakeup_r, 512)
+            except BlockingIOError:
+                pass
+
+    def _wait_ready(self, worker: Worker, timeout: float) -> bool:
+        """Wait until a worker reports that it accepts requests."""
+        deadline = time.monotonic() + timeout
+        while not worker.ready and worker.pid in self.workers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stopping:
+                return False
+            readable, _, _ = select.select([worker.ready_fd], [], [], min(remaining, 0.5))
+            if readable:
+                self._read_ready(worker)
+            self._reap()
+        return worker.ready
+
+    def _poll_ready(self):
+        """Collect readiness reports of newly started workers."""
+        pending = [w for w in self.workers.values() if not w.ready and w.ready_fd >= 0]
+        if not pending:
+            return
+        readable, _, _ = select.select([w.ready_fd for w in pending], [], [], 0)
+        for worker in pending:
+            if worker.ready_fd in readable:
+                self._read_ready(worker)
+
+    def _read_ready(self, worker: Worker):
+        """Read a worker's readiness byte and close its pipe."""
+        worker.ready = os.read(worker.ready_fd, 1) == b"1"
+        os.close(worker.ready_fd)
+        worker.ready_fd = -1
+        if worker.ready:
+            logger.info(
+                "Worker %d ready in %.3fs", worker.pid, time.monotonic() - worker.started_at
+            )
+
+    def _retire(self, pid: int):
+        """Ask a worker to finish its requests and exit."""
+        if pid not in self.workers:
+            # Already exited and reaped (e.g. crashed during a rolling restart)
+            return
+        self.retiring.add(pid)
+        self._signal(pid, signal.SIGTERM)
+
+    def _reap(self, block: bool = False):
+        """Collect exited workers."""
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, 0 if block else os.WNOHANG)
+            except ChildProcessError:
+                self.workers.clear()
+                return
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            if worker is None:
+                continue
+            if worker.ready_fd >= 0:
+                os.close(worker.ready_fd)
+            if pid in self.retiring:
+                self.retiring.discard(pid)
+            else:
+                logger.warning(
+                    "Worker %d exited unexpectedly (exit code %d)",
+                    pid, os.waitstatus_to_exitcode(status),
+                )
+            if block:
+                return
+
+    def _maintain_worker_count(self):
+        """Replace crashed workers, rate-limited against crash loops."""
+        active = len(self.workers) - len(self.retiring)
+        if active >= self.args.workers:
+            return
+        if time.monotonic() - self._last_respawn < RESPAWN_BACKOFF:
+            return
+        self._last_respawn = time.monotonic()
+        self.spawn()
+
+    def _signal(self, pid: int, sig: int):
+        """Send a signal to a worker that may already have exited."""
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    workers = parser.add_mutually_exclusive_group()
+    workers.add_argument("--workers", type=int, default=1,
+                         help="number of worker processes (default: 1; state is per process)")
+    workers.add_argument("--workers-per-cpu", action="store_true",
+                         help="start one worker per available CPU")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--graceful-timeout", type=int, default=30,
+                        help="seconds a stopping worker may spend finishing requests")
+    parser.add_argument("--keep-alive", type=int, default=5,
+                        help="seconds to keep idle HTTP connections open")
+    parser.add_argument("--no-preload", dest="preload", action="store_false",
+                        help="import the app in each worker (SIGHUP then reloads code)")
+    parser.add_argument("--forwarded-allow-ips", default="127.0.0.1")
+    parser.add_argument("--no-access-log", dest="access_log", action="store_false")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+    if args.workers_per_cpu:
+        args.workers = cpu_workers()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s [serve %(process)d] %(levelname)s: %(message)s",
+    )
+    Master(args).run()
+
+
+if __name__ == "__main__":
+    main()
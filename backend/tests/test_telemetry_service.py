@@ -0,0 +1,69 @@
+"""Tests for the telemetry ring buffers and downsampling tiers."""
+from app.models.telemetry import TelemetryResolution
+from app.services.telemetry_service import LineTelemetry, RingSeries
+
+# An hour boundary, so bucket starts are easy to predict
+HOUR_START = 1_700_000_000 - 1_700_000_000 % 3600
+
+RUNNING = 0
+
+
+def _series(line: LineTelemetry, resolution: TelemetryResolution):
+    return line.series(resolution, float("-inf"), float("inf"), 1000)
+
+
+def test_ring_series_keeps_the_latest_points_in_order():
+    ring = RingSeries(3)
+    for ts in range(5):
+        ring.append(float(ts), 50.0, 50.0, 50.0, 1.0, RUNNING, 1)
+
+    assert len(ring) == 3
+    assert [ring[i] for i in range(len(ring))] == [2.0, 3.0, 4.0]
+    assert [p.timestamp.timestamp() for p in ring.window(3.0, 10.0, 10)] == [3.0, 4.0]
+    assert [p.timestamp.timestamp() for p in ring.window(0.0, 10.0, 2)] == [3.0, 4.0]
+
+
+def test_minute_buckets_aggregate_samples():
+    line = LineTelemetry("1")
+    line.add(HOUR_START, 40.0, 1.0, RUNNING)
+    line.add(HOUR_START + 30, 60.0, 3.0, RUNNING)
+    line.add(HOUR_START + 60, 80.0, 5.0, RUNNING)
+
+    closed, open_minute = _series(line, TelemetryResolution.MINUTE)
+    assert closed.samples == 2
+    assert closed.efficiency == 50.0
+    assert (closed.efficiency_min, closed.efficiency_max) == (40.0, 60.0)
+    assert closed.output == 2.0
+    assert open_minute.samples == 1
+    assert open_minute.timestamp.timestamp() == HOUR_START + 60
+
+
+def test_out_of_order_samples_are_rejected():
+    line = LineTelemetry("1")
+    assert line.add(HOUR_START + 10, 50.0, 1.0, RUNNING)
+    assert not line.add(HOUR_START, 50.0, 1.0, RUNNING)
+    assert line.samples_total == 1
+
+
+def test_hour_series_keeps_completed_hour_after_rollover():
+    line = LineTelemetry("1")
+    for i in range(120):
+        line.add(HOUR_START + i * 30, 50.0, 1.0, RUNNING)
+    line.add(HOUR_START + 3600 + 5, 70.0, 1.0, RUNNING)
+
+    points = _series(line, TelemetryResolution.HOUR)
+    assert [p.timestamp.timestamp() for p in points] == [HOUR_START, HOUR_START + 3600]
+    assert [p.samples for p in points] == [120, 1]
+    assert points[0].efficiency == 50.0
+
+
+def test_hour_series_after_the_open_minute_closes():
+    line = LineTelemetry("1")
+    for i in range(120):
+        line.add(HOUR_START + i * 30, 50.0, 1.0, RUNNING)
+    line.add(HOUR_START + 3600 + 5, 70.0, 1.0, RUNNING)
+    line.add(HOUR_START + 3600 + 65, 90.0, 1.0, RUNNING)
+
+    points = _series(line, TelemetryResolution.HOUR)
+    assert [p.samples for p in points] == [120, 2]
+    assert points[1].efficiency == 80.0
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useLanguage } from '../context/LanguageContext';
-import { maintenanceApi } from '../services/maintenanceApi';
+import { maintenanceApi, splitPhotoBatches } from '../services/maintenanceApi';
 import { ArrowLeft, Upload, X, Camera, CheckCircle } from 'lucide-react';
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card';
 import { Button } from './ui/button';
@@ -53,23 +53,48 @@ export function UploadPhotoReport() {
   const handleUpload = async () => {
     if (!id || files.length === 0) return;
 
+    const accepted = new Set<File>();
+    let failed = false;
+
     try {
       setUploading(true);
       setUploadedCount(0);
 
-      for (let i = 0; i < files.length; i++) {
-        await maintenanceApi.uploadPhoto(id, files[i]);
-        setUploadedCount(i + 1);
+      // Upload in batches the server accepts; a rejected photo does not stop the rest
+      for (const batch of splitPhotoBatches(files)) {
+        const { results } = await maintenanceApi.uploadPhotos(id, batch);
+        results.forEach((result, index) => {
+          if (result.success) accepted.add(batch[index]);
+        });
+        setUploadedCount(accepted.size);
+
+        const rejected = results.filter(result => !result.success);
+        if (rejected.length > 0) {
+          console.error('Some photos were rejected:', rejected);
+          failed = true;
+        }
       }
-
-      // Navigate back to report detail
-      navigate(`/maintenance/failure-reports/${id}`);
     } catch (error) {
       console.error('Error uploading photos:', error);
-      alert(t('maintenance.uploadError'));
+      failed = true;
     } finally {
       setUploading(false);
     }
+
+    if (!failed) {
+      // Navigate back to report detail
+      navigate(`/maintenance/failure-reports/${id}`);
+      return;
+    }
+
+    // Keep only the photos that were not stored, so a retry does not upload them twice
+    const keep = files.map(file => !accepted.has(file));
+    previews.forEach((preview, index) => {
+      if (!keep[index]) URL.revokeObjectURL(preview);
+    });
+    setFiles(files.filter((_, index) => keep[index]));
+    setPreviews(previews.filter((_, index) => keep[index]));
+    alert(t('maintenance.uploadError'));
   };
 
   return (
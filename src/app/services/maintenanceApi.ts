@@ -1,6 +1,37 @@
 /** Maintenance API service */
 const API_BASE_URL = 'http://localhost:8000/api/v1/maintenance';
 
+// Batch photo upload limits, mirroring the backend config
+export const MAX_PHOTO_BATCH_FILES = 20;
+export const MAX_FILE_SIZE = 10 * 1024 * 1024;
+const MULTIPART_OVERHEAD = 64 * 1024;
+export const MAX_PHOTO_BATCH_REQUEST_SIZE =
+  MAX_PHOTO_BATCH_FILES * (MAX_FILE_SIZE + MULTIPART_OVERHEAD);
+
+/** Split photos into batches within the server's file-count and body-size limits */
+export function splitPhotoBatches(files: File[]): File[][] {
+  const batches: File[][] = [];
+  let batch: File[] = [];
+  let batchSize = 0;
+
+  files.forEach(file => {
+    const size = file.size + MULTIPART_OVERHEAD;
+    if (
+      batch.length > 0 &&
+      (batch.length >= MAX_PHOTO_BATCH_FILES || batchSize + size > MAX_PHOTO_BATCH_REQUEST_SIZE)
+    ) {
+      batches.push(batch);
+      batch = [];
+      batchSize = 0;
+    }
+    batch.push(file);
+    batchSize += size;
+  });
+
+  if (batch.length > 0) batches.push(batch);
+  return batches;
+}
+
 export type MaintenanceStatus = 'open' | 'in_progress' | 'closed';
 
 export interface FailureReport {
@@ -21,6 +52,18 @@ export interface FailureReport {
   total_duration_minutes?: number;
 }
 
+export interface PhotoUploadResult {
+  filename?: string;
+  success: boolean;
+  photo_url?: string;
+  error?: string;
+}
+
+export interface PhotoBatchResult {
+  report: FailureReport;
+  results: PhotoUploadResult[];
+}
+
 export interface FailureReportCreate {
   line_id: string;
   line_name: string;
@@ -118,6 +161,24 @@ class MaintenanceApiService {
     return response.json();
   }
 
+  async uploadPhotos(reportId: string, files: File[]): Promise<PhotoBatchResult> {
+    const formData = new FormData();
+    files.forEach(file => formData.append('files', file));
+
+    const url = `${API_BASE_URL}/failure-reports/${reportId}/photos/batch`;
+    const response = await fetch(url, {
+      method: 'POST',
+      body: formData,
+    });
+
+    if (!response.ok) {
+      const error = await response.json().catch(() => ({ detail: 'Unknown error' }));
+      throw new Error(error.detail || `HTTP error! status: ${response.status}`);
+    }
+
+    return response.json();
+  }
+
   async deleteFailureReport(reportId: string): Promise<void> {
     await this.request<void>(`/failure-reports/${reportId}`, {
       method: 'DELETE',